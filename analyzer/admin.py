@@ -1,5 +1,8 @@
 from django.contrib import admin
-from .models import UserProfile, Resume, Job, SkillAnalysis, Notification
+from .models import (
+    UserProfile, Resume, Job, SkillAnalysis, Skill, AnalysisSkill, AnalysisTask,
+    SkillTaxonomyVersion, Notification, ArchivedNotification
+)
 
 
 @admin.register(UserProfile)
@@ -11,10 +14,18 @@ class UserProfileAdmin(admin.ModelAdmin):
 
 @admin.register(Resume)
 class ResumeAdmin(admin.ModelAdmin):
-    list_display = ['user', 'resume_file', 'uploaded_at']
-    list_filter = ['uploaded_at']
+    list_display = ['user', 'resume_file', 'extraction_status', 'uploaded_at']
+    list_filter = ['extraction_status', 'uploaded_at']
+    list_select_related = ['user']
     search_fields = ['user__username']
-    readonly_fields = ['extracted_text']
+    readonly_fields = ['extracted_text', 'extraction_error']
+
+    def get_queryset(self, request):
+        queryset = super().get_queryset(request)
+        # Only the change form shows the extracted text
+        if not (request.resolver_match and request.resolver_match.url_name.endswith('_changelist')):
+            queryset = queryset.with_text()
+        return queryset
 
 
 @admin.register(Job)
@@ -22,6 +33,7 @@ class JobAdmin(admin.ModelAdmin):
     list_display = ['title', 'hr', 'created_at']
     list_filter = ['created_at']
     search_fields = ['title', 'hr__username']
+    readonly_fields = ['parsed_skills']
 
 
 @admin.register(SkillAnalysis)
@@ -32,8 +44,45 @@ class SkillAnalysisAdmin(admin.ModelAdmin):
     readonly_fields = ['matched_skills', 'missing_skills']
 
 
+@admin.register(Skill)
+class SkillAdmin(admin.ModelAdmin):
+    list_display = ['name']
+    search_fields = ['name']
+
+
+@admin.register(AnalysisSkill)
+class AnalysisSkillAdmin(admin.ModelAdmin):
+    list_display = ['analysis', 'skill', 'label', 'status']
+    list_filter = ['status']
+    search_fields = ['skill__name', 'label']
+    raw_id_fields = ['analysis', 'skill']
+
+
+@admin.register(AnalysisTask)
+class AnalysisTaskAdmin(admin.ModelAdmin):
+    list_display = ['id', 'resume', 'job', 'status', 'attempts', 'created_at', 'finished_at']
+    list_filter = ['status', 'created_at']
+    search_fields = ['resume__user__username', 'job__title']
+    raw_id_fields = ['resume', 'job', 'requested_by', 'analysis']
+
+
+@admin.register(SkillTaxonomyVersion)
+class SkillTaxonomyVersionAdmin(admin.ModelAdmin):
+    list_display = ['fingerprint', 'applied_at']
+    readonly_fields = ['fingerprint', 'predefined_skills', 'skill_synonyms', 'applied_at']
+
+
 @admin.register(Notification)
 class NotificationAdmin(admin.ModelAdmin):
     list_display = ['user', 'message', 'is_read', 'created_at']
     list_filter = ['is_read', 'created_at']
-    search_fields = ['user__username', 'message']
\ No newline at end of file
+    search_fields = ['user__username', 'message']
+
+
+@admin.register(ArchivedNotification)
+class ArchivedNotificationAdmin(admin.ModelAdmin):
+    list_display = ['user', 'created_at', 'archived_at']
+    list_filter = ['created_at']
+    search_fields = ['user__username']
+    readonly_fields = ['user', 'message', 'created_at', 'archived_at']
+    exclude = ['compressed_message']
@@ -0,0 +1,113 @@
+from string import Template
+
+from django.db import transaction
+
+from .models import Notification, UserStats
+from .utils import get_skill_suggestions
+
+ACCEPT = 'ACCEPT'
+REJECT = 'REJECT'
+FEEDBACK = 'FEEDBACK'
+DECISION_CHOICES = [
+    (ACCEPT, 'Accept'),
+    (REJECT, 'Reject'),
+    (FEEDBACK, 'Send feedback'),
+]
+
+
+def display_name(user):
+    return user.get_full_name() or user.username
+
+
+def personalize(text, analysis):
+    """Fill $candidate, $job and $score placeholders in HR-written text"""
+    return Template(text).safe_substitute(
+        candidate=display_name(analysis.resume.user),
+        job=analysis.job.title,
+        score=analysis.match_score,
+    )
+
+
+def acceptance_message(analysis):
+    # Without emojis for database compatibility
+    message = f"Congratulations! Your application for the position '{analysis.job.title}' has been accepted.\n\n"
+    message += f"Match Score: {analysis.match_score}%\n"
+    message += f"The HR team will contact you soon with next steps.\n\n"
+    message += f"Best regards,\n{display_name(analysis.job.hr)}"
+    return message
+
+
+def rejection_message(analysis, feedback=''):
+    message = f"Thank you for your interest in the position '{analysis.job.title}'.\n\n"
+    message += f"After careful consideration, we have decided to move forward with other candidates whose qualifications more closely match our current needs.\n\n"
+
+    if feedback:
+        message += f"Feedback from our team:\n{feedback}\n\n"
+
+    # Add skill gap information
+    _, missing_skills = analysis.get_skill_lists()
+    if missing_skills:
+        message += f"Skills to develop for future opportunities:\n"
+        for skill in missing_skills[:5]:  # Limit to top 5
+            message += f"- {skill}\n"
+        message += "\n"
+
+    message += f"We encourage you to continue developing your skills and apply for future openings.\n\n"
+    message += f"Best regards,\n{display_name(analysis.job.hr)}"
+    return message
+
+
+def feedback_message(analysis, feedback):
+    matched_skills, missing_skills = analysis.get_skill_lists()
+    suggestions = get_skill_suggestions(missing_skills, matched_skills)
+
+    message = f"Feedback for your application to '{analysis.job.title}'\n\n"
+    message += f"From: {display_name(analysis.job.hr)}\n\n"
+    message += f"{feedback}\n\n"
+    message += f"--- Performance Summary ---\n"
+    message += f"Match Score: {analysis.match_score}%\n"
+    message += f"Readiness Level: {analysis.get_readiness_level_display()}\n\n"
+
+    if suggestions:
+        message += "Skill Development Recommendations:\n"
+        for suggestion in suggestions:
+            # Remove emojis from suggestions
+            clean_suggestion = suggestion.replace('📚', '-').replace('💡', '-').replace('🎯', '-').replace('🔗', '-').replace('✓', '').replace('⚠️', '')
+            message += f"{clean_suggestion}\n"
+
+    message += f"\nKeep improving and best of luck!\n"
+    return message
+
+
+def decision_message(analysis, decision, feedback=''):
+    feedback = personalize(feedback, analysis) if feedback else ''
+    if decision == ACCEPT:
+        return acceptance_message(analysis)
+    if decision == REJECT:
+        return rejection_message(analysis, feedback)
+    return feedback_message(analysis, feedback)
+
+
+def notify_candidates(analyses, decision, feedback='', batch_size=500):
+    """Send a decision to the candidates of many analyses with one batched insert.
+
+    Analyses should come with resume__user, job__hr and skill_entries loaded.
+    A candidate with several analyses in the batch is notified once, about
+    the first one. Returns the number of candidates notified.
+    """
+    notifications = []
+    notified = set()
+    for analysis in analyses:
+        user_id = analysis.resume.user_id
+        if user_id in notified:
+            continue
+        notified.add(user_id)
+        notifications.append(Notification(user_id=user_id, message=decision_message(analysis, decision, feedback)))
+
+    user_ids = list(notified)
+    with transaction.atomic():
+        Notification.objects.bulk_create(notifications, batch_size=batch_size)
+        # bulk_create skips the signals that keep unread counts in step
+        for start in range(0, len(user_ids), batch_size):
+            UserStats.recount(user_ids[start:start + batch_size], ['unread_notification_count'])
+    return len(notifications)
@@ -2,7 +2,8 @@ from django import forms
 from django.contrib.auth.forms import UserCreationForm
 from django.contrib.auth.models import User
 from django.core.exceptions import ValidationError
-from .models import Resume, Job
+from .decisions import DECISION_CHOICES, FEEDBACK
+from .models import Resume, Job, SkillAnalysis
 import re
 
 
@@ -156,4 +157,77 @@ class FilterForm(forms.Form):
         user = kwargs.pop('user', None)
         super().__init__(*args, **kwargs)
         if user:
-            self.fields['job'].queryset = Job.objects.filter(hr=user)
\ No newline at end of file
+            self.fields['job'].queryset = Job.objects.filter(hr=user)
+    
+    def filter_queryset(self, analyses):
+        """Narrow a SkillAnalysis queryset down to the valid filters"""
+        if not self.is_valid():
+            return analyses
+        
+        if self.cleaned_data['min_match_score']:
+            analyses = analyses.filter(match_score__gte=self.cleaned_data['min_match_score'])
+        
+        if self.cleaned_data['max_gap_percentage']:
+            analyses = analyses.filter(gap_percentage__lte=self.cleaned_data['max_gap_percentage'])
+        
+        if self.cleaned_data['readiness_level']:
+            analyses = analyses.filter(readiness_level=self.cleaned_data['readiness_level'])
+        
+        if self.cleaned_data['job']:
+            analyses = analyses.filter(job=self.cleaned_data['job'])
+        
+        return analyses
+
+
+class BatchDecisionForm(forms.Form):
+    job = forms.ModelChoiceField(
+        queryset=Job.objects.none(),
+        widget=forms.Select(attrs={'class': 'form-control'})
+    )
+    decision = forms.ChoiceField(
+        choices=DECISION_CHOICES,
+        widget=forms.Select(attrs={'class': 'form-control'})
+    )
+    min_match_score = forms.FloatField(
+        min_value=0, max_value=100, required=False,
+        widget=forms.NumberInput(attrs={'class': 'form-control', 'placeholder': 'From score (inclusive)'})
+    )
+    below_match_score = forms.FloatField(
+        min_value=0, max_value=100, required=False,
+        widget=forms.NumberInput(attrs={'class': 'form-control', 'placeholder': 'Below score'})
+    )
+    feedback = forms.CharField(
+        required=False,
+        widget=forms.Textarea(attrs={
+            'class': 'form-control',
+            'rows': 5,
+            'placeholder': 'Message for every candidate. $candidate, $job and $score are filled in per candidate.'
+        })
+    )
+    
+    def __init__(self, *args, **kwargs):
+        user = kwargs.pop('user', None)
+        super().__init__(*args, **kwargs)
+        if user:
+            self.fields['job'].queryset = Job.objects.filter(hr=user)
+    
+    def clean(self):
+        cleaned_data = super().clean()
+        if cleaned_data.get('decision') == FEEDBACK and not cleaned_data.get('feedback'):
+            raise ValidationError("Please write the feedback to send.")
+        
+        low = cleaned_data.get('min_match_score')
+        high = cleaned_data.get('below_match_score')
+        if low is not None and high is not None and low >= high:
+            raise ValidationError("The lower score bound must be below the upper one.")
+        
+        return cleaned_data
+    
+    def get_analyses(self):
+        """The job's analyses in the chosen score range, best first"""
+        analyses = SkillAnalysis.objects.filter(job=self.cleaned_data['job'])
+        if self.cleaned_data['min_match_score'] is not None:
+            analyses = analyses.filter(match_score__gte=self.cleaned_data['min_match_score'])
+        if self.cleaned_data['below_match_score'] is not None:
+            analyses = analyses.filter(match_score__lt=self.cleaned_data['below_match_score'])
+        return analyses.order_by('-match_score', 'id')
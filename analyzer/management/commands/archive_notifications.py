@@ -0,0 +1,52 @@
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.utils import timezone
+
+from analyzer.models import ArchivedNotification, Notification
+
+
+class Command(BaseCommand):
+    help = 'Move read notifications older than N days out of the notification table in batches'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--days', type=int, default=90,
+                            help='Archive read notifications older than this many days (default: 90)')
+        parser.add_argument('--batch-size', type=int, default=1000,
+                            help='Notifications moved per transaction')
+        parser.add_argument('--delete', action='store_true',
+                            help='Delete the notifications instead of archiving them')
+        parser.add_argument('--dry-run', action='store_true',
+                            help='Only report how many notifications would be moved')
+
+    def handle(self, *args, **options):
+        cutoff = timezone.now() - timedelta(days=options['days'])
+        old = Notification.objects.filter(is_read=True, created_at__lt=cutoff).order_by('id')
+        total = old.count()
+        action = 'delete' if options['delete'] else 'archive'
+        self.stdout.write(f'Found {total} read notifications older than {options["days"]} days to {action}...')
+        if options['dry_run'] or not total:
+            return
+
+        batch_size = max(options['batch_size'], 1)
+        moved = 0
+        last_id = 0
+        while True:
+            # Keyset batches keep each query and transaction small
+            batch = list(old.filter(id__gt=last_id)[:batch_size])
+            if not batch:
+                break
+
+            with transaction.atomic():
+                if not options['delete']:
+                    ArchivedNotification.objects.bulk_create(
+                        [ArchivedNotification.from_notification(notification) for notification in batch]
+                    )
+                Notification.objects.filter(id__in=[notification.id for notification in batch]).delete()
+
+            moved += len(batch)
+            last_id = batch[-1].id
+            self.stdout.write(f'[{moved}/{total}] Moved up to notification ID {last_id}')
+
+        self.stdout.write(self.style.SUCCESS(f'{moved} notifications {action}d.'))
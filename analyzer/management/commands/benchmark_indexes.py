@@ -0,0 +1,176 @@
+import os
+import random
+import shutil
+import tempfile
+import time
+
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.core.management.base import BaseCommand
+from django.db import connections
+
+from analyzer.models import Job, Notification, Resume, SkillAnalysis
+
+BENCHMARK_DB = 'index_benchmark'
+INDEXED_MODELS = [SkillAnalysis, Resume, Job, Notification]
+
+
+class Command(BaseCommand):
+    help = 'Compare query plans and timings of the hot query paths with and without their indexes'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--analyses', type=int, default=1000000,
+                            help='Skill analyses to seed (default: 1,000,000)')
+        parser.add_argument('--jobs', type=int, default=100,
+                            help='Jobs the analyses are spread over')
+        parser.add_argument('--hr-users', type=int, default=20,
+                            help='HR users owning the jobs')
+        parser.add_argument('--repeat', type=int, default=5,
+                            help='Runs per query when timing')
+        parser.add_argument('--batch-size', type=int, default=10000,
+                            help='Rows per insert while seeding')
+
+    def handle(self, *args, **options):
+        # Seed a throwaway SQLite database so real data is never touched
+        directory = tempfile.mkdtemp(prefix='index_benchmark_')
+        connections.databases[BENCHMARK_DB] = connections.configure_settings({
+            'default': connections.databases['default'],
+            BENCHMARK_DB: {
+                'ENGINE': 'django.db.backends.sqlite3',
+                'NAME': os.path.join(directory, 'benchmark.sqlite3'),
+            },
+        })[BENCHMARK_DB]
+
+        try:
+            call_command('migrate', database=BENCHMARK_DB, verbosity=0)
+            self.seed(options)
+
+            queries = self.get_queries()
+            with_indexes = {label: self.measure(qs, options['repeat']) for label, qs in queries}
+            self.drop_indexes()
+            without_indexes = {label: self.measure(qs, options['repeat']) for label, qs in queries}
+
+            for label, _ in queries:
+                indexed_time, indexed_plan = with_indexes[label]
+                plain_time, plain_plan = without_indexes[label]
+                self.stdout.write(self.style.MIGRATE_HEADING(f'\n{label}'))
+                self.stdout.write(f'  with indexes:    {indexed_time * 1000:9.2f} ms')
+                self.stdout.write(f'  without indexes: {plain_time * 1000:9.2f} ms')
+                self.stdout.write('  plan with indexes:')
+                self.stdout.write(self.indent(indexed_plan))
+                self.stdout.write('  plan without indexes:')
+                self.stdout.write(self.indent(plain_plan))
+        finally:
+            connections[BENCHMARK_DB].close()
+            del connections[BENCHMARK_DB]
+            del connections.databases[BENCHMARK_DB]
+            shutil.rmtree(directory, ignore_errors=True)
+
+    def seed(self, options):
+        rng = random.Random(0)
+        batch_size = options['batch_size']
+        job_count = max(options['jobs'], 1)
+        resume_count = -(-options['analyses'] // job_count)
+        self.stdout.write(
+            f'Seeding {options["hr_users"]} HR users, {job_count} jobs, '
+            f'{resume_count} resumes and {resume_count * job_count} analyses...'
+        )
+
+        users = User.objects.using(BENCHMARK_DB)
+        users.bulk_create(
+            [User(username=f'hr{i}', password='!') for i in range(options['hr_users'])]
+            + [User(username=f'candidate{i}', password='!') for i in range(resume_count)],
+            batch_size=batch_size,
+        )
+        hr_ids = list(users.filter(username__startswith='hr').values_list('id', flat=True))
+        candidate_ids = list(users.filter(username__startswith='candidate').values_list('id', flat=True))
+
+        Job.objects.using(BENCHMARK_DB).bulk_create([
+            Job(hr_id=hr_ids[i % len(hr_ids)], title=f'Job {i}', description='', required_skills='Python')
+            for i in range(job_count)
+        ])
+        job_ids = list(Job.objects.using(BENCHMARK_DB).values_list('id', flat=True))
+
+        Resume.objects.using(BENCHMARK_DB).bulk_create(
+            [Resume(user_id=user_id, resume_file='resumes/benchmark.pdf') for user_id in candidate_ids],
+            batch_size=batch_size,
+        )
+        resume_ids = list(Resume.objects.using(BENCHMARK_DB).values_list('id', flat=True))
+
+        Notification.objects.using(BENCHMARK_DB).bulk_create(
+            [
+                Notification(user_id=user_id, message='Update', is_read=rng.random() < 0.8)
+                for user_id in candidate_ids for _ in range(5)
+            ],
+            batch_size=batch_size,
+        )
+
+        readiness_levels = [choice for choice, _ in SkillAnalysis.READINESS_CHOICES]
+        batch = []
+        for resume_id in resume_ids:
+            for job_id in job_ids:
+                score = round(rng.uniform(0, 100), 2)
+                batch.append(SkillAnalysis(
+                    resume_id=resume_id,
+                    job_id=job_id,
+                    matched_skills='',
+                    missing_skills='',
+                    match_score=score,
+                    gap_percentage=round(100 - score, 2),
+                    readiness_level=rng.choice(readiness_levels),
+                ))
+                if len(batch) >= batch_size:
+                    SkillAnalysis.objects.using(BENCHMARK_DB).bulk_create(batch)
+                    batch = []
+        SkillAnalysis.objects.using(BENCHMARK_DB).bulk_create(batch)
+
+        with connections[BENCHMARK_DB].cursor() as cursor:
+            cursor.execute('ANALYZE')
+
+    def get_queries(self):
+        """The query shapes of the hot views, run against seeded users and jobs"""
+        hr = User.objects.using(BENCHMARK_DB).filter(username__startswith='hr').first()
+        candidate = User.objects.using(BENCHMARK_DB).filter(username__startswith='candidate').last()
+        job = Job.objects.using(BENCHMARK_DB).filter(hr=hr).first()
+        analyses = SkillAnalysis.objects.using(BENCHMARK_DB)
+
+        return [
+            ('filter_resumes: by HR, score >= 70, ordered by score',
+             analyses.filter(job__hr=hr, match_score__gte=70).order_by('-match_score')[:20]),
+            ('filter_resumes: by job and readiness level',
+             analyses.filter(job=job, readiness_level='JOB_READY').order_by('-match_score')[:20]),
+            ('job_detail: candidates for a job by score',
+             analyses.filter(job=job).order_by('-match_score')[:20]),
+            ('hr_dashboard: recent analyses',
+             analyses.filter(job__in=Job.objects.using(BENCHMARK_DB).filter(hr=hr).values('id'))
+             .values_list('id', flat=True)[:10]),
+            ('dashboard: recent analyses of a candidate',
+             analyses.filter(resume__user=candidate).order_by('-analyzed_at')[:5]),
+            ('dashboard: recent resumes of a candidate',
+             Resume.objects.using(BENCHMARK_DB).filter(user=candidate).order_by('-uploaded_at')[:5]),
+            ('dashboard: unread notifications',
+             Notification.objects.using(BENCHMARK_DB).filter(user=candidate, is_read=False)
+             .order_by('-created_at')[:5]),
+            ('job_list: jobs of an HR user',
+             Job.objects.using(BENCHMARK_DB).filter(hr=hr).order_by('-created_at')[:10]),
+            ('available_jobs: newest jobs',
+             Job.objects.using(BENCHMARK_DB).order_by('-created_at')[:10]),
+        ]
+
+    def measure(self, queryset, repeat):
+        plan = queryset.explain()
+        timings = []
+        for _ in range(max(repeat, 1)):
+            started = time.perf_counter()
+            list(queryset.all())
+            timings.append(time.perf_counter() - started)
+        return min(timings), plan
+
+    def drop_indexes(self):
+        with connections[BENCHMARK_DB].schema_editor() as editor:
+            for model in INDEXED_MODELS:
+                for index in model._meta.indexes:
+                    editor.remove_index(model, index)
+
+    def indent(self, text):
+        return '\n'.join(f'    {line}' for line in text.splitlines())
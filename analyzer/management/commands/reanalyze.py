@@ -0,0 +1,108 @@
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from analyzer.models import SkillAnalysis, SkillTaxonomyVersion
+from analyzer.tasks import build_resume_payloads, map_payloads, save_resume_results
+from analyzer.utils import SKILL_TAXONOMY_FINGERPRINT
+
+
+class Command(BaseCommand):
+    help = 'Re-score skill analyses in resumable, parallel chunks'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--chunk-size', type=int, default=1000,
+                            help='Analyses loaded and written back per chunk')
+        parser.add_argument('--processes', type=int, default=os.cpu_count() or 1,
+                            help='Worker processes for extraction and scoring (default: CPU count)')
+        parser.add_argument('--checkpoint', default=str(settings.BASE_DIR / 'reanalyze_checkpoint.json'),
+                            help='File recording the last analysis id processed')
+        parser.add_argument('--restart', action='store_true',
+                            help='Ignore any existing checkpoint and start from the beginning')
+        parser.add_argument('--incremental', action='store_true',
+                            help='Only re-score analyses affected by taxonomy changes since the last run')
+
+    def handle(self, *args, **options):
+        checkpoint_path = options['checkpoint']
+        last_id = 0 if options['restart'] else self.load_checkpoint(checkpoint_path)
+
+        analyses = SkillAnalysis.objects.all()
+        if options['incremental']:
+            version = SkillTaxonomyVersion.latest()
+            if version is None:
+                self.stdout.write('No taxonomy version recorded yet; re-scoring everything.')
+            elif version.fingerprint == SKILL_TAXONOMY_FINGERPRINT:
+                self.stdout.write(self.style.SUCCESS('Skill taxonomy unchanged; nothing to re-score.'))
+                return
+            else:
+                self.stdout.write(f'Changed taxonomy terms: {", ".join(sorted(version.changed_terms()))}')
+                analyses = version.affected_analyses()
+
+        analyses = (
+            analyses.select_related('resume', 'job')
+            .exclude(resume__extracted_text='')
+            .order_by('id')
+        )
+        remaining = analyses.filter(id__gt=last_id).count()
+        if last_id:
+            self.stdout.write(f'Resuming after analysis ID {last_id}.')
+        self.stdout.write(f'Found {remaining} analyses to process...')
+
+        processes = max(options['processes'], 1)
+        executor = ProcessPoolExecutor(max_workers=processes) if processes > 1 else None
+        processed = 0
+        errors = 0
+
+        try:
+            while True:
+                # Keyset pagination keeps every chunk query as cheap as the first
+                chunk = list(analyses.filter(id__gt=last_id)[:options['chunk_size']])
+                if not chunk:
+                    break
+
+                results_by_resume = {
+                    result['resume_id']: result
+                    for result in map_payloads(build_resume_payloads(chunk), executor)
+                }
+                save_resume_results(results_by_resume)
+
+                for result in results_by_resume.values():
+                    if result['error']:
+                        errors += 1
+                        self.stdout.write(f'ERROR resume {result["resume_id"]}: {result["error"]}')
+
+                processed += len(chunk)
+                last_id = chunk[-1].id
+                self.save_checkpoint(checkpoint_path, last_id)
+                self.stdout.write(f'[{processed}/{remaining}] Processed up to analysis ID {last_id}')
+        finally:
+            if executor is not None:
+                executor.shutdown()
+
+        if os.path.exists(checkpoint_path):
+            os.remove(checkpoint_path)
+        SkillTaxonomyVersion.record_current()
+
+        self.stdout.write(self.style.SUCCESS(
+            f'Re-analysis complete: {processed} analyses processed, {errors} resume errors.'
+        ))
+
+    def load_checkpoint(self, path):
+        try:
+            with open(path) as f:
+                checkpoint = json.load(f)
+        except (OSError, ValueError):
+            return 0
+
+        # A checkpoint from before a taxonomy change would skip rows that need re-scoring
+        if checkpoint.get('taxonomy') != SKILL_TAXONOMY_FINGERPRINT:
+            self.stdout.write('Skill taxonomy changed since the checkpoint; starting over.')
+            return 0
+        return checkpoint.get('last_id', 0)
+
+    def save_checkpoint(self, path, last_id):
+        with open(path, 'w') as f:
+            json.dump({'last_id': last_id, 'taxonomy': SKILL_TAXONOMY_FINGERPRINT}, f)
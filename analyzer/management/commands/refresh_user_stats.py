@@ -0,0 +1,21 @@
+from django.core.management.base import BaseCommand
+
+from analyzer.models import UserStats
+
+
+class Command(BaseCommand):
+    help = 'Recompute the stored dashboard counters of every user from the rows they count'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=1000,
+                            help='Users recounted per UPDATE')
+
+    def handle(self, *args, **options):
+        user_ids = list(UserStats.objects.order_by('user_id').values_list('user_id', flat=True))
+        self.stdout.write(f'Recounting dashboard counters of {len(user_ids)} users...')
+
+        batch_size = max(options['batch_size'], 1)
+        for start in range(0, len(user_ids), batch_size):
+            UserStats.recount(user_ids[start:start + batch_size])
+
+        self.stdout.write(self.style.SUCCESS('Dashboard counters recounted.'))
@@ -0,0 +1,58 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from django.core.management.base import BaseCommand
+
+from analyzer.models import SkillAnalysis
+from analyzer.reports import render_reports
+
+
+class Command(BaseCommand):
+    help = 'Render and cache the PDF reports of many analyses in parallel, e.g. before a shortlist review'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--job', type=int, action='append', dest='jobs',
+                            help='Only render reports for this job ID (repeatable)')
+        parser.add_argument('--min-score', type=float,
+                            help='Only render reports of analyses scoring at least this much')
+        parser.add_argument('--chunk-size', type=int, default=500,
+                            help='Analyses loaded per chunk')
+        parser.add_argument('--processes', type=int, default=os.cpu_count() or 1,
+                            help='Worker processes rendering PDFs (default: CPU count)')
+
+    def handle(self, *args, **options):
+        analyses = SkillAnalysis.objects.all()
+        if options['jobs']:
+            analyses = analyses.filter(job_id__in=options['jobs'])
+        if options['min_score'] is not None:
+            analyses = analyses.filter(match_score__gte=options['min_score'])
+        analyses = (
+            analyses.select_related('resume__user', 'job')
+            .only('id', 'match_score', 'gap_percentage', 'readiness_level', 'analyzed_at', 'updated_at',
+                  'matched_skills', 'missing_skills', 'resume__user__username',
+                  'resume__user__first_name', 'resume__user__last_name', 'job__title')
+            .prefetch_related('skill_entries')
+            .order_by('id')
+        )
+        total = analyses.count()
+        self.stdout.write(f'Found {total} analyses...')
+
+        processes = max(options['processes'], 1)
+        executor = ProcessPoolExecutor(max_workers=processes) if processes > 1 else None
+        done = 0
+        last_id = 0
+
+        try:
+            while True:
+                chunk = list(analyses.filter(id__gt=last_id)[:options['chunk_size']])
+                if not chunk:
+                    break
+                render_reports(chunk, executor)
+                done += len(chunk)
+                last_id = chunk[-1].id
+                self.stdout.write(f'[{done}/{total}] Reports cached up to analysis ID {last_id}')
+        finally:
+            if executor is not None:
+                executor.shutdown()
+
+        self.stdout.write(self.style.SUCCESS(f'{done} reports cached.'))
@@ -0,0 +1,79 @@
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from analyzer.tasks import claim_tasks, requeue_stale_tasks, run_tasks
+
+
+# Slack on top of the longest a batch can take before its tasks count as abandoned
+STALE_MARGIN_SECONDS = 300
+
+
+class Command(BaseCommand):
+    help = 'Process queued resume extraction and analysis tasks'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--once', action='store_true',
+                            help='Exit once the queue is empty instead of polling')
+        parser.add_argument('--processes', type=int, default=os.cpu_count() or 1,
+                            help='Worker processes for text extraction and scoring (default: CPU count)')
+        parser.add_argument('--batch-size', type=int, default=50,
+                            help='Tasks claimed and written back per batch')
+        parser.add_argument('--poll-interval', type=float, default=2.0,
+                            help='Seconds to wait between polls when the queue is empty')
+        parser.add_argument('--stale-after', type=int,
+                            help='Seconds after which a running task is assumed abandoned '
+                                 '(default: batch size x RESUME_EXTRACTION_TIMEOUT plus a margin)')
+        parser.add_argument('--max-attempts', type=int, default=3,
+                            help='Attempts before an abandoned task is marked failed')
+
+    def handle(self, *args, **options):
+        processes = max(options['processes'], 1)
+
+        # A whole batch is claimed at once, so its tasks share a start time and
+        # may legitimately run for as long as the batch does
+        min_stale_after = options['batch_size'] * settings.RESUME_EXTRACTION_TIMEOUT
+        if options['stale_after'] is None:
+            options['stale_after'] = min_stale_after + STALE_MARGIN_SECONDS
+        elif options['stale_after'] <= min_stale_after:
+            raise CommandError(
+                f'--stale-after must exceed {min_stale_after}s (batch size x RESUME_EXTRACTION_TIMEOUT), '
+                'or tasks still running would be requeued and analyzed twice.'
+            )
+        self.stdout.write(f'Analysis worker started with {processes} process(es).')
+
+        # Pool processes only extract and score; all database writes stay here
+        executor = ProcessPoolExecutor(max_workers=processes) if processes > 1 else None
+
+        try:
+            while True:
+                requeued, failed = requeue_stale_tasks(options['stale_after'], options['max_attempts'])
+                if requeued or failed:
+                    self.stdout.write(f'Requeued {requeued} stale tasks, failed {failed}.')
+
+                tasks = claim_tasks(options['batch_size'])
+                if not tasks:
+                    if options['once']:
+                        break
+                    time.sleep(options['poll_interval'])
+                    continue
+
+                run_tasks(tasks, executor=executor, on_result=self.report_result)
+                done = sum(task.status == task.DONE for task in tasks)
+                self.stdout.write(f'Batch finished: {done}/{len(tasks)} tasks done.')
+        except KeyboardInterrupt:
+            self.stdout.write('Stopping analysis worker.')
+        finally:
+            if executor is not None:
+                executor.shutdown()
+
+        self.stdout.write(self.style.SUCCESS('Analysis worker finished.'))
+
+    def report_result(self, result):
+        if result['error']:
+            self.stdout.write(f'Resume {result["resume_id"]}: failed - {result["error"]}')
+        else:
+            self.stdout.write(f'Resume {result["resume_id"]}: scored against {len(result["match_results"])} job(s)')
@@ -1,7 +1,7 @@
 from django.core.management.base import BaseCommand
 from django.contrib.auth.models import User
 from analyzer.models import Job, UserProfile, Resume, SkillAnalysis, Notification
-from analyzer.utils import extract_skills_from_text, calculate_skill_match, determine_readiness_level, format_skills_list, parse_skills_from_string
+from analyzer.utils import calculate_skill_match
 from django.core.files.base import ContentFile
 import os
 
@@ -134,24 +134,17 @@ class Command(BaseCommand):
                 # Check if analysis already exists
                 if not SkillAnalysis.objects.filter(resume=resume, job=job).exists():
                     # Extract skills from resume
-                    resume_skills = extract_skills_from_text(resume.extracted_text)
+                    resume_skills = resume.get_skills()
                     
                     # Parse job skills
-                    job_skills = parse_skills_from_string(job.required_skills)
+                    job_skills = job.get_required_skills()
                     
                     # Calculate match
                     match_result = calculate_skill_match(resume_skills, job_skills)
                     
                     # Create analysis
-                    analysis = SkillAnalysis.objects.create(
-                        resume=resume,
-                        job=job,
-                        matched_skills=format_skills_list(match_result['matched_skills']),
-                        missing_skills=format_skills_list(match_result['missing_skills']),
-                        gap_percentage=match_result['gap_percentage'],
-                        match_score=match_result['match_score'],
-                        readiness_level=determine_readiness_level(match_result['match_score'])
-                    )
+                    analysis = SkillAnalysis(resume=resume, job=job)
+                    analysis.apply_match_result(match_result)
                     
                     analysis_count += 1
                     
@@ -0,0 +1,23 @@
+# Generated by Django 4.2 on 2026-10-18 11:52
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('analyzer', '0002_skillanalysis_updated_at'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='resume',
+            name='extracted_skills',
+            field=models.JSONField(blank=True, default=list),
+        ),
+        migrations.AddField(
+            model_name='resume',
+            name='skills_fingerprint',
+            field=models.CharField(blank=True, max_length=64),
+        ),
+    ]
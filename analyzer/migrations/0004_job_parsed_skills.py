@@ -0,0 +1,105 @@
+# Generated by Django 4.2 on 2026-10-18 11:53
+
+import re
+
+from django.db import migrations, models
+
+
+def parse_skills_from_string(skills_string):
+    """Frozen copy of analyzer.utils.parse_skills_from_string as of this migration"""
+    if not skills_string:
+        return []
+
+    # Step 1: Handle parentheses - extract both main skill and sub-skills
+    # e.g., "AWS (EC2, S3, IAM)" -> ["AWS", "EC2", "S3", "IAM"]
+    def extract_with_parentheses(text):
+        results = []
+        pattern = r'([A-Za-z0-9\s\.\-]+)\s*\(([^\)]+)\)'
+        matches = re.findall(pattern, text)
+
+        for main, subs in matches:
+            main = main.strip()
+            if main and len(main) > 1:
+                results.append(main)
+            # Split sub-skills by comma
+            for sub in re.split(r'[,;]\s*', subs):
+                sub = sub.strip()
+                if sub and len(sub) > 1:
+                    results.append(sub)
+            # Remove the matched part from text
+            text = re.sub(r'[A-Za-z0-9\s\.\-]+\s*\([^\)]+\)', '', text, count=1)
+
+        return results, text
+
+    paren_skills, skills_string = extract_with_parentheses(skills_string)
+
+    # Step 2: Remove category labels (e.g., "Programming Skill:", "Framework:", etc.)
+    skills_string = re.sub(r'(?:^|\n|\s)([A-Za-z\s&]+):\s*', ', ', skills_string, flags=re.MULTILINE)
+
+    # Step 3: Replace bullets and special characters with commas
+    skills_string = re.sub(r'\s*[•\-\*]\s*', ', ', skills_string)
+    skills_string = re.sub(r'\s*[\n;]\s*', ', ', skills_string)
+
+    # Step 4: Split by comma or 'and'
+    skills = re.split(r',|\s+and\s+', skills_string)
+
+    # Step 5: Clean each skill
+    cleaned_skills = []
+    for skill in skills + paren_skills:
+        skill = skill.strip()
+
+        # Remove asterisks and extra whitespace
+        skill = re.sub(r'[\*]+', '', skill)
+        skill = re.sub(r'\s+', ' ', skill)
+
+        # Skip empty, very short, or invalid skills
+        if not skill or len(skill) < 2:
+            continue
+
+        # Skip common non-skill phrases
+        skip_phrases = ['or a related field', 'proven experience', 'strong proficiency',
+                       'experience with', 'knowledge of', 'ability to', 'e.g.', 'such as',
+                       'understanding', 'concepts']
+        if any(phrase in skill.lower() for phrase in skip_phrases):
+            continue
+
+        # Skip if it's just a category name
+        if skill.endswith(':'):
+            continue
+
+        cleaned_skills.append(skill)
+
+    # Remove duplicates while preserving order
+    seen = set()
+    unique_skills = []
+    for skill in cleaned_skills:
+        skill_lower = skill.lower()
+        if skill_lower not in seen:
+            seen.add(skill_lower)
+            unique_skills.append(skill)
+
+    return unique_skills
+
+
+def populate_parsed_skills(apps, schema_editor):
+    db_alias = schema_editor.connection.alias
+    Job = apps.get_model('analyzer', 'Job')
+    for job in Job.objects.using(db_alias).only('id', 'required_skills').iterator():
+        job.parsed_skills = parse_skills_from_string(job.required_skills)
+        job.save(update_fields=['parsed_skills'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('analyzer', '0003_resume_extracted_skills'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='job',
+            name='parsed_skills',
+            field=models.JSONField(blank=True, default=list),
+        ),
+        migrations.RunPython(populate_parsed_skills, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,257 @@
+# Generated by Django 4.2 on 2026-10-18 11:54
+
+import re
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+# Synonym variants and the canonical skill names they normalized to when
+# this migration was written; other names normalize to themselves
+CANONICAL_FORMS = {
+    'ai': 'artificial intelligence',
+    'amazon web services': 'aws',
+    'analytical': 'problem solving',
+    'analytical skills': 'problem solving',
+    'analytics': 'data analysis',
+    'angular.js': 'angular',
+    'angularjs': 'angular',
+    'api': 'rest api',
+    'apis': 'rest api',
+    'bachelor degree': 'bachelor',
+    'bachelors': 'bachelor',
+    'bachelors degree': 'bachelor',
+    'basic seo': 'seo',
+    'be': 'bachelor',
+    'bootstrap 4': 'bootstrap',
+    'bootstrap 5': 'bootstrap',
+    'bsc': 'bachelor',
+    'btech': 'bachelor',
+    'communicate': 'communication',
+    'continuous deployment': 'ci/cd',
+    'continuous integration': 'ci/cd',
+    'cs': 'computer science',
+    'css3': 'css',
+    'data analyst': 'data analysis',
+    'data analytics': 'data analysis',
+    'data modelling': 'data modeling',
+    'data visualisation': 'data visualization',
+    'database': 'sql',
+    'databases': 'sql',
+    'django framework': 'django',
+    'ecmascript': 'javascript',
+    'express.js': 'express',
+    'expressjs': 'express',
+    'full-stack': 'full stack',
+    'fullstack': 'full stack',
+    'git hub': 'github',
+    'go': 'golang',
+    'google cloud': 'gcp',
+    'google cloud platform': 'gcp',
+    'html5': 'html',
+    'information technology': 'computer science',
+    'it': 'computer science',
+    'js': 'javascript',
+    'k8s': 'kubernetes',
+    'microsoft azure': 'azure',
+    'microsoft excel': 'excel',
+    'microsoft sql server': 'sql server',
+    'ml': 'machine learning',
+    'modeling': 'data modeling',
+    'modelling': 'data modeling',
+    'mongo': 'mongodb',
+    'ms excel': 'excel',
+    'mssql': 'sql server',
+    'my sql': 'mysql',
+    'nlp': 'natural language processing',
+    'node.js': 'node',
+    'nodejs': 'node',
+    'object-oriented': 'object oriented programming',
+    'oop': 'object oriented programming',
+    'postgres': 'postgresql',
+    'power-bi': 'power bi',
+    'powerbi': 'power bi',
+    'presentation': 'communication',
+    'problem-solving': 'problem solving',
+    'py': 'python',
+    'python 2': 'python',
+    'python 3': 'python',
+    'react.js': 'react',
+    'reactjs': 'react',
+    'responsive': 'responsive design',
+    'responsive web design': 'responsive design',
+    'rest': 'rest api',
+    'rest apis': 'rest api',
+    'restful': 'rest api',
+    'restful api': 'rest api',
+    'scikit learn': 'scikit-learn',
+    'search engine optimization': 'seo',
+    'sklearn': 'scikit-learn',
+    'spreadsheet': 'excel',
+    'statistical': 'statistics',
+    'statistical analysis': 'statistics',
+    'tableau desktop': 'tableau',
+    'tdd': 'test driven development',
+    'test-driven': 'test driven development',
+    'ts': 'typescript',
+    'ui design': 'ui/ux',
+    'user experience': 'ui/ux',
+    'user interface': 'ui/ux',
+    'ux design': 'ui/ux',
+    'visual studio code': 'vs code',
+    'visualisation': 'data visualization',
+    'visualization': 'data visualization',
+    'vscode': 'vs code',
+    'vue.js': 'vue',
+    'vuejs': 'vue',
+    'web design': 'responsive design',
+}
+
+
+def parse_skills_from_string(skills_string):
+    """Frozen copy of analyzer.utils.parse_skills_from_string as of this migration"""
+    if not skills_string:
+        return []
+
+    # Step 1: Handle parentheses - extract both main skill and sub-skills
+    # e.g., "AWS (EC2, S3, IAM)" -> ["AWS", "EC2", "S3", "IAM"]
+    def extract_with_parentheses(text):
+        results = []
+        pattern = r'([A-Za-z0-9\s\.\-]+)\s*\(([^\)]+)\)'
+        matches = re.findall(pattern, text)
+
+        for main, subs in matches:
+            main = main.strip()
+            if main and len(main) > 1:
+                results.append(main)
+            # Split sub-skills by comma
+            for sub in re.split(r'[,;]\s*', subs):
+                sub = sub.strip()
+                if sub and len(sub) > 1:
+                    results.append(sub)
+            # Remove the matched part from text
+            text = re.sub(r'[A-Za-z0-9\s\.\-]+\s*\([^\)]+\)', '', text, count=1)
+
+        return results, text
+
+    paren_skills, skills_string = extract_with_parentheses(skills_string)
+
+    # Step 2: Remove category labels (e.g., "Programming Skill:", "Framework:", etc.)
+    skills_string = re.sub(r'(?:^|\n|\s)([A-Za-z\s&]+):\s*', ', ', skills_string, flags=re.MULTILINE)
+
+    # Step 3: Replace bullets and special characters with commas
+    skills_string = re.sub(r'\s*[•\-\*]\s*', ', ', skills_string)
+    skills_string = re.sub(r'\s*[\n;]\s*', ', ', skills_string)
+
+    # Step 4: Split by comma or 'and'
+    skills = re.split(r',|\s+and\s+', skills_string)
+
+    # Step 5: Clean each skill
+    cleaned_skills = []
+    for skill in skills + paren_skills:
+        skill = skill.strip()
+
+        # Remove asterisks and extra whitespace
+        skill = re.sub(r'[\*]+', '', skill)
+        skill = re.sub(r'\s+', ' ', skill)
+
+        # Skip empty, very short, or invalid skills
+        if not skill or len(skill) < 2:
+            continue
+
+        # Skip common non-skill phrases
+        skip_phrases = ['or a related field', 'proven experience', 'strong proficiency',
+                       'experience with', 'knowledge of', 'ability to', 'e.g.', 'such as',
+                       'understanding', 'concepts']
+        if any(phrase in skill.lower() for phrase in skip_phrases):
+            continue
+
+        # Skip if it's just a category name
+        if skill.endswith(':'):
+            continue
+
+        cleaned_skills.append(skill)
+
+    # Remove duplicates while preserving order
+    seen = set()
+    unique_skills = []
+    for skill in cleaned_skills:
+        skill_lower = skill.lower()
+        if skill_lower not in seen:
+            seen.add(skill_lower)
+            unique_skills.append(skill)
+
+    return unique_skills
+
+
+def normalize_skill(skill):
+    """Frozen copy of analyzer.utils.normalize_skill as of this migration"""
+    skill_lower = skill.lower().strip()
+    return CANONICAL_FORMS.get(skill_lower, skill_lower)
+
+
+def populate_skill_entries(apps, schema_editor):
+    db_alias = schema_editor.connection.alias
+    SkillAnalysis = apps.get_model('analyzer', 'SkillAnalysis')
+    Skill = apps.get_model('analyzer', 'Skill')
+    AnalysisSkill = apps.get_model('analyzer', 'AnalysisSkill')
+
+    skills = {}
+    entries = []
+    analyses = SkillAnalysis.objects.using(db_alias).only('id', 'matched_skills', 'missing_skills')
+    for analysis in analyses.iterator(chunk_size=2000):
+        labelled = [(label, 'MATCHED') for label in parse_skills_from_string(analysis.matched_skills)]
+        labelled += [(label, 'MISSING') for label in parse_skills_from_string(analysis.missing_skills)]
+
+        for position, (label, status) in enumerate(labelled):
+            name = normalize_skill(label)[:255]
+            if name not in skills:
+                skills[name], _ = Skill.objects.using(db_alias).get_or_create(name=name)
+            entries.append(AnalysisSkill(
+                analysis_id=analysis.id, skill=skills[name],
+                status=status, label=label, position=position,
+            ))
+
+        if len(entries) >= 2000:
+            AnalysisSkill.objects.using(db_alias).bulk_create(entries)
+            entries = []
+
+    AnalysisSkill.objects.using(db_alias).bulk_create(entries)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('analyzer', '0004_job_parsed_skills'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Skill',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=255, unique=True)),
+            ],
+            options={
+                'ordering': ['name'],
+            },
+        ),
+        migrations.CreateModel(
+            name='AnalysisSkill',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('status', models.CharField(choices=[('MATCHED', 'Matched'), ('MISSING', 'Missing')], max_length=10)),
+                ('label', models.TextField()),
+                ('position', models.PositiveIntegerField(default=0)),
+                ('analysis', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='skill_entries', to='analyzer.skillanalysis')),
+                ('skill', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='analysis_entries', to='analyzer.skill')),
+            ],
+            options={
+                'ordering': ['position'],
+            },
+        ),
+        migrations.AddIndex(
+            model_name='analysisskill',
+            index=models.Index(fields=['skill', 'status'], name='analyzer_an_skill_i_7bbd61_idx'),
+        ),
+        migrations.RunPython(populate_skill_entries, migrations.RunPython.noop),
+    ]
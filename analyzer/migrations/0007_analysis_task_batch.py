@@ -0,0 +1,18 @@
+# Generated by Django 4.2 on 2026-10-18 11:59
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('analyzer', '0006_analysis_task'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='analysistask',
+            name='batch',
+            field=models.UUIDField(blank=True, db_index=True, null=True),
+        ),
+    ]
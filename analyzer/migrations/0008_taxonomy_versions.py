@@ -0,0 +1,39 @@
+# Generated by Django 4.2 on 2026-10-18 12:02
+
+from django.db import migrations, models
+import django.db.models.deletion
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('analyzer', '0007_analysis_task_batch'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SkillTaxonomyVersion',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('fingerprint', models.CharField(max_length=64, unique=True)),
+                ('predefined_skills', models.JSONField()),
+                ('skill_synonyms', models.JSONField()),
+                ('applied_at', models.DateTimeField(default=django.utils.timezone.now)),
+            ],
+            options={
+                'ordering': ['-applied_at'],
+            },
+        ),
+        migrations.CreateModel(
+            name='ResumeTerm',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('term', models.CharField(max_length=64)),
+                ('resume', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='terms', to='analyzer.resume')),
+            ],
+            options={
+                'unique_together': {('term', 'resume')},
+            },
+        ),
+    ]
@@ -0,0 +1,49 @@
+# Generated by Django 4.2 on 2026-10-18 12:06
+
+import hashlib
+import os
+
+from django.db import migrations, models
+
+
+def hash_file(file):
+    """Frozen copy of analyzer.utils.hash_file as of this migration"""
+    digest = hashlib.sha256()
+    for chunk in file.chunks():
+        digest.update(chunk)
+    file.seek(0)
+    return digest.hexdigest()
+
+
+def populate_content_hashes(apps, schema_editor):
+    db_alias = schema_editor.connection.alias
+    Resume = apps.get_model('analyzer', 'Resume')
+    for resume in Resume.objects.using(db_alias).exclude(resume_file='').iterator():
+        resume.original_filename = os.path.basename(resume.resume_file.name)
+        try:
+            with resume.resume_file.open('rb') as f:
+                resume.content_hash = hash_file(f)
+        except OSError:
+            pass
+        resume.save(update_fields=['content_hash', 'original_filename'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('analyzer', '0008_taxonomy_versions'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='resume',
+            name='content_hash',
+            field=models.CharField(blank=True, db_index=True, max_length=64),
+        ),
+        migrations.AddField(
+            model_name='resume',
+            name='original_filename',
+            field=models.CharField(blank=True, max_length=255),
+        ),
+        migrations.RunPython(populate_content_hashes, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,47 @@
+# Generated by Django 4.2 on 2026-10-18 12:08
+
+from django.db import migrations, models
+
+
+def populate_extraction_status(apps, schema_editor):
+    db_alias = schema_editor.connection.alias
+    Resume = apps.get_model('analyzer', 'Resume')
+    Resume.objects.using(db_alias).exclude(extracted_text='').update(extraction_status='OK')
+
+    # Parser errors used to be stored as the resume text
+    failures = [
+        ('Error extracting', 'INVALID'),
+        ('Unsupported file format', 'UNSUPPORTED'),
+    ]
+    for prefix, status in failures:
+        for resume in Resume.objects.using(db_alias).filter(extracted_text__startswith=prefix).only('id', 'extracted_text'):
+            resume.extraction_status = status
+            resume.extraction_error = resume.extracted_text
+            resume.extracted_text = ''
+            resume.extracted_skills = []
+            resume.skills_fingerprint = ''
+            resume.save(update_fields=[
+                'extraction_status', 'extraction_error', 'extracted_text',
+                'extracted_skills', 'skills_fingerprint',
+            ])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('analyzer', '0009_resume_content_hash'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='resume',
+            name='extraction_error',
+            field=models.TextField(blank=True),
+        ),
+        migrations.AddField(
+            model_name='resume',
+            name='extraction_status',
+            field=models.CharField(choices=[('PENDING', 'Pending'), ('OK', 'Extracted'), ('INVALID', 'Unreadable file'), ('UNSUPPORTED', 'Unsupported format'), ('TIMEOUT', 'Timed out'), ('MEMORY', 'Memory limit exceeded'), ('CRASHED', 'Parser crashed')], default='PENDING', max_length=12),
+        ),
+        migrations.RunPython(populate_extraction_status, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,37 @@
+# Generated by Django 4.2 on 2026-10-18 12:11
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('analyzer', '0010_resume_extraction_status'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='job',
+            index=models.Index(fields=['hr', '-created_at'], name='analyzer_jo_hr_id_02ab7f_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='job',
+            index=models.Index(fields=['-created_at'], name='analyzer_jo_created_80147e_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='notification',
+            index=models.Index(fields=['user', 'is_read', '-created_at'], name='analyzer_no_user_id_7a5521_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='resume',
+            index=models.Index(fields=['user', '-uploaded_at'], name='analyzer_re_user_id_3b53f3_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='skillanalysis',
+            index=models.Index(fields=['job', '-match_score', 'id'], name='analyzer_sk_job_id_20dc9e_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='skillanalysis',
+            index=models.Index(fields=['job', 'readiness_level', '-match_score'], name='analyzer_sk_job_id_a421a5_idx'),
+        ),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 4.2 on 2026-10-18 12:20
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('auth', '0012_alter_user_first_name_max_length'),
+        ('analyzer', '0011_hot_path_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='UserStats',
+            fields=[
+                ('user', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='stats', serialize=False, to=settings.AUTH_USER_MODEL)),
+                ('resume_count', models.IntegerField(default=0)),
+                ('analysis_count', models.IntegerField(default=0)),
+                ('unread_notification_count', models.IntegerField(default=0)),
+                ('job_count', models.IntegerField(default=0)),
+                ('job_analysis_count', models.IntegerField(default=0)),
+                ('job_score_total', models.FloatField(default=0)),
+            ],
+        ),
+    ]
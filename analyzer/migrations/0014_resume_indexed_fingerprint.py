@@ -0,0 +1,41 @@
+# Generated by Django 4.2 on 2026-10-18 12:36
+
+import hashlib
+
+from django.db import migrations, models
+
+
+def mark_indexed_resumes(apps, schema_editor):
+    # Resumes that already have term rows were indexed from their current text
+    db_alias = schema_editor.connection.alias
+    Resume = apps.get_model('analyzer', 'Resume')
+    ResumeTerm = apps.get_model('analyzer', 'ResumeTerm')
+    indexed = (
+        Resume.objects.using(db_alias)
+        .filter(id__in=ResumeTerm.objects.using(db_alias).values('resume_id'))
+        .only('id', 'extracted_text')
+    )
+    batch = []
+    for resume in indexed.iterator(chunk_size=2000):
+        resume.indexed_fingerprint = hashlib.sha256(resume.extracted_text.encode('utf-8')).hexdigest()
+        batch.append(resume)
+        if len(batch) >= 2000:
+            Resume.objects.using(db_alias).bulk_update(batch, ['indexed_fingerprint'])
+            batch = []
+    Resume.objects.using(db_alias).bulk_update(batch, ['indexed_fingerprint'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('analyzer', '0013_archived_notifications'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='resume',
+            name='indexed_fingerprint',
+            field=models.CharField(blank=True, max_length=64),
+        ),
+        migrations.RunPython(mark_indexed_resumes, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 4.2 on 2026-10-18 12:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('analyzer', '0014_resume_indexed_fingerprint'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='skillanalysis',
+            index=models.Index(fields=['-analyzed_at'], name='analyzer_sk_analyze_45d8ff_idx'),
+        ),
+    ]
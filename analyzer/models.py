@@ -1,7 +1,19 @@
-from django.db import models
+from django.db import models, transaction
+from django.db.models import Count, F, Min, OuterRef, Subquery, Sum
+from django.db.models.functions import Coalesce
 from django.contrib.auth.models import User
+from django.utils import timezone
 from django.core.validators import FileExtensionValidator
 import os
+import zlib
+
+from .utils import (
+    extract_skills_from_text, get_skills_fingerprint, get_text_fingerprint, parse_skills_from_string,
+    normalize_skill, determine_readiness_level, format_skills_list,
+    get_predefined_skills, get_skill_synonyms, diff_taxonomies, get_text_terms,
+    get_skill_term_pieces, hash_file, ExtractionError,
+    SKILL_TAXONOMY_FINGERPRINT
+)
 
 
 class UserProfile(models.Model):
@@ -19,23 +31,175 @@ class UserProfile(models.Model):
 
 
 def resume_upload_path(instance, filename):
+    # Hashed uploads are stored once per distinct content
+    if instance.content_hash:
+        extension = os.path.splitext(filename)[1].lower()
+        return f'resumes/content/{instance.content_hash[:2]}/{instance.content_hash}{extension}'
     return f'resumes/{instance.user.id}/{filename}'
 
 
+class ResumeQuerySet(models.QuerySet):
+    # Columns that can run to hundreds of KB and that no list page shows
+    TEXT_FIELDS = ['extracted_text', 'extracted_skills', 'extraction_error']
+
+    def with_text(self):
+        """Fetch resumes with their extracted text, for the extraction and analysis paths.
+
+        Call it before only(), which would otherwise drop the deferred columns.
+        """
+        return self.defer(None)
+
+
+class ResumeManager(models.Manager.from_queryset(ResumeQuerySet)):
+    def get_queryset(self):
+        # The text columns are loaded on demand; see ResumeQuerySet.with_text()
+        return super().get_queryset().defer(*ResumeQuerySet.TEXT_FIELDS)
+
+
 class Resume(models.Model):
+    EXTRACTION_PENDING = 'PENDING'
+    EXTRACTION_OK = 'OK'
+    EXTRACTION_STATUS_CHOICES = [
+        (EXTRACTION_PENDING, 'Pending'),
+        (EXTRACTION_OK, 'Extracted'),
+        (ExtractionError.INVALID, 'Unreadable file'),
+        (ExtractionError.UNSUPPORTED, 'Unsupported format'),
+        (ExtractionError.TIMEOUT, 'Timed out'),
+        (ExtractionError.MEMORY, 'Memory limit exceeded'),
+        (ExtractionError.CRASHED, 'Parser crashed'),
+    ]
+
     user = models.ForeignKey(User, on_delete=models.CASCADE)
     resume_file = models.FileField(
         upload_to=resume_upload_path,
         validators=[FileExtensionValidator(allowed_extensions=['pdf', 'docx'])]
     )
     extracted_text = models.TextField(blank=True)
+    extracted_skills = models.JSONField(default=list, blank=True)
+    skills_fingerprint = models.CharField(max_length=64, blank=True)
+    # Fingerprint of the text the resume's term rows were built from, blank until indexed
+    indexed_fingerprint = models.CharField(max_length=64, blank=True)
+    extraction_status = models.CharField(max_length=12, choices=EXTRACTION_STATUS_CHOICES, default=EXTRACTION_PENDING)
+    extraction_error = models.TextField(blank=True)
+    content_hash = models.CharField(max_length=64, blank=True, db_index=True)
+    original_filename = models.CharField(max_length=255, blank=True)
     uploaded_at = models.DateTimeField(auto_now_add=True)
 
+    objects = ResumeManager()
+
     def __str__(self):
-        return f"{self.user.username} - {os.path.basename(self.resume_file.name)}"
+        return f"{self.user.username} - {self.filename}"
+
+    @property
+    def extraction_failed(self):
+        return self.extraction_status not in (self.EXTRACTION_PENDING, self.EXTRACTION_OK)
+
+    @property
+    def filename(self):
+        """Name the file was uploaded with"""
+        return self.original_filename or os.path.basename(self.resume_file.name)
+
+    @classmethod
+    def create_from_upload(cls, user, uploaded_file):
+        """Create a resume, sharing the stored file and extracted data of identical uploads"""
+        content_hash = hash_file(uploaded_file)
+        resume = cls(
+            user=user,
+            content_hash=content_hash,
+            original_filename=os.path.basename(uploaded_file.name),
+        )
+
+        # Text and skills of a known file are reused instead of parsed again,
+        # and a file that failed to parse is not handed to the parser twice
+        known = (
+            cls.objects.with_text().filter(content_hash=content_hash)
+            .exclude(extraction_status=cls.EXTRACTION_PENDING)
+            .first()
+        )
+        if known:
+            resume.extracted_text = known.extracted_text
+            resume.extracted_skills = known.extracted_skills
+            resume.skills_fingerprint = known.skills_fingerprint
+            resume.extraction_status = known.extraction_status
+            resume.extraction_error = known.extraction_error
+
+        storage = resume.resume_file.storage
+        name = resume_upload_path(resume, uploaded_file.name)
+        if storage.exists(name):
+            resume.resume_file.name = name
+        else:
+            resume.resume_file.save(uploaded_file.name, uploaded_file, save=False)
+
+        with transaction.atomic():
+            resume.save()
+            if resume.extracted_text:
+                ResumeTerm.index_resumes([resume])
+        return resume
+
+    def delete_file(self):
+        """Delete the stored file unless another resume shares it"""
+        if not self.resume_file:
+            return
+        shared = Resume.objects.filter(resume_file=self.resume_file.name).exclude(id=self.id).exists()
+        if not shared:
+            self.resume_file.delete(save=False)
+
+    def get_skills(self):
+        """Get extracted skills, re-extracting only when the text or taxonomy changed"""
+        fingerprint = get_skills_fingerprint(self.extracted_text)
+        if self.skills_fingerprint != fingerprint:
+            self.extracted_skills = extract_skills_from_text(self.extracted_text)
+            self.skills_fingerprint = fingerprint
+            if self.pk:
+                self.save(update_fields=['extracted_skills', 'skills_fingerprint'])
+        return self.extracted_skills
 
     class Meta:
         ordering = ['-uploaded_at']
+        indexes = [
+            # Dashboard and resume history list a user's resumes newest first
+            models.Index(fields=['user', '-uploaded_at']),
+        ]
+
+
+class ResumeTerm(models.Model):
+    """Inverted index from the word tokens of a resume's text to the resume"""
+    resume = models.ForeignKey(Resume, on_delete=models.CASCADE, related_name='terms')
+    term = models.CharField(max_length=64)
+
+    def __str__(self):
+        return f"{self.term} - {self.resume_id}"
+
+    @classmethod
+    def index_resumes(cls, resumes, batch_size=2000):
+        """Rebuild the term rows of resumes from their extracted_text"""
+        resumes = list(resumes)
+        entries = []
+        for resume in resumes:
+            entries += [cls(resume_id=resume.id, term=term) for term in get_text_terms(resume.extracted_text)]
+            resume.indexed_fingerprint = get_text_fingerprint(resume.extracted_text)
+
+        with transaction.atomic():
+            cls.objects.filter(resume__in=[resume.id for resume in resumes]).delete()
+            cls.objects.bulk_create(entries, batch_size=batch_size)
+            # Marks resumes whose text has no terms as indexed too
+            Resume.objects.bulk_update(resumes, ['indexed_fingerprint'], batch_size=batch_size)
+
+    @classmethod
+    def candidate_resumes(cls, skill):
+        """Get indexed resumes holding every word of a skill (plural last word allowed)"""
+        pieces = get_skill_term_pieces(skill)
+        if not pieces:
+            return Resume.objects.none()
+
+        required = [[piece] for piece in pieces[:-1]] + [[pieces[-1], pieces[-1] + 's']]
+        resumes = Resume.objects.all()
+        for terms in required:
+            resumes = resumes.filter(id__in=cls.objects.filter(term__in=terms).values('resume_id'))
+        return resumes
+
+    class Meta:
+        unique_together = ['term', 'resume']
 
 
 class Job(models.Model):
@@ -43,13 +207,46 @@ class Job(models.Model):
     title = models.CharField(max_length=200)
     description = models.TextField()
     required_skills = models.TextField()
+    parsed_skills = models.JSONField(default=list, blank=True)
     created_at = models.DateTimeField(auto_now_add=True)
 
     def __str__(self):
         return self.title
 
+    def save(self, *args, **kwargs):
+        # Parse required skills once here instead of on every analysis
+        self.parsed_skills = parse_skills_from_string(self.required_skills)
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and 'required_skills' in update_fields:
+            kwargs['update_fields'] = {*update_fields, 'parsed_skills'}
+        super().save(*args, **kwargs)
+
+    def get_required_skills(self):
+        """Get the parsed required skills, parsing only if they were never stored"""
+        if not self.parsed_skills and self.required_skills:
+            return parse_skills_from_string(self.required_skills)
+        return self.parsed_skills
+
     class Meta:
         ordering = ['-created_at']
+        indexes = [
+            # An HR user's jobs, and the newest jobs on candidate pages
+            models.Index(fields=['hr', '-created_at']),
+            models.Index(fields=['-created_at']),
+        ]
+
+
+class SkillAnalysisQuerySet(models.QuerySet):
+    # Columns the analysis tables in the dashboards and candidate lists show
+    LISTING_FIELDS = [
+        'id', 'resume', 'job', 'match_score', 'gap_percentage', 'readiness_level', 'analyzed_at',
+        'resume__user__username', 'resume__user__first_name', 'resume__user__last_name',
+        'resume__user__email', 'job__title', 'job__created_at',
+    ]
+
+    def for_listing(self):
+        """Fetch analyses with their candidate and job in one query, skipping the skill text"""
+        return self.select_related('resume__user', 'job').only(*self.LISTING_FIELDS)
 
 
 class SkillAnalysis(models.Model):
@@ -71,12 +268,321 @@ class SkillAnalysis(models.Model):
     analyzed_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)  # ✅ FIX ADDED
 
+    objects = SkillAnalysisQuerySet.as_manager()
+
     def __str__(self):
         return f"{self.resume.user.username} - {self.job.title} ({self.match_score}%)"
 
+    MATCH_FIELDS = ['matched_skills', 'missing_skills', 'gap_percentage', 'match_score', 'readiness_level']
+
+    def set_match_fields(self, match_result):
+        """Copy a calculate_skill_match result onto the analysis without saving"""
+        self.matched_skills = format_skills_list(match_result['matched_skills'])
+        self.missing_skills = format_skills_list(match_result['missing_skills'])
+        self.gap_percentage = match_result['gap_percentage']
+        self.match_score = match_result['match_score']
+        self.readiness_level = determine_readiness_level(match_result['match_score'])
+
+    def apply_match_result(self, match_result):
+        """Save a calculate_skill_match result, including its normalized skill rows"""
+        self.set_match_fields(match_result)
+
+        with transaction.atomic():
+            self.save()
+            self.skill_entries.all().delete()
+            AnalysisSkill.objects.bulk_create(
+                AnalysisSkill.build_entries(self, match_result['matched_skills'], match_result['missing_skills'])
+            )
+
+    @classmethod
+    def bulk_apply_match_results(cls, results, batch_size=500):
+        """Save many (resume_id, job_id, match_result) results with batched queries.
+
+        Returns the saved analyses keyed by (resume_id, job_id).
+        """
+        # A pair scored twice keeps its latest result
+        results = list({(resume_id, job_id): (resume_id, job_id, match_result)
+                        for resume_id, job_id, match_result in results}.values())
+        if not results:
+            return {}
+        keys = {(resume_id, job_id) for resume_id, job_id, _ in results}
+
+        def fetch_analyses():
+            analyses = cls.objects.filter(
+                resume_id__in={resume_id for resume_id, _ in keys},
+                job_id__in={job_id for _, job_id in keys},
+            )
+            return {(a.resume_id, a.job_id): a for a in analyses if (a.resume_id, a.job_id) in keys}
+
+        with transaction.atomic():
+            existing = fetch_analyses()
+            resume_owners = dict(
+                Resume.objects.filter(id__in={resume_id for resume_id, _ in keys}).values_list('id', 'user')
+            )
+            job_owners = dict(Job.objects.filter(id__in={job_id for _, job_id in keys}).values_list('id', 'hr'))
+            # Counter changes per user, from each pair's old and new score
+            deltas = {}
+            new_analyses = []
+            for resume_id, job_id, match_result in results:
+                analysis = existing.get((resume_id, job_id))
+                hr_deltas = deltas.setdefault(job_owners[job_id], {})
+                if analysis is None:
+                    analysis = cls(resume_id=resume_id, job_id=job_id)
+                    new_analyses.append(analysis)
+                    candidate_deltas = deltas.setdefault(resume_owners[resume_id], {})
+                    candidate_deltas['analysis_count'] = candidate_deltas.get('analysis_count', 0) + 1
+                    hr_deltas['job_analysis_count'] = hr_deltas.get('job_analysis_count', 0) + 1
+                    old_score = 0
+                else:
+                    old_score = analysis.match_score
+                analysis.set_match_fields(match_result)
+                analysis.updated_at = timezone.now()
+                hr_deltas['job_score_total'] = hr_deltas.get('job_score_total', 0) + analysis.match_score - old_score
+
+            cls.objects.bulk_create(new_analyses, batch_size=batch_size)
+            cls.objects.bulk_update(existing.values(), cls.MATCH_FIELDS + ['updated_at'], batch_size=batch_size)
+
+            # Not every backend returns primary keys from bulk_create, so reload
+            saved = fetch_analyses()
+            UserStats.adjust_each(deltas)
+            AnalysisSkill.objects.filter(analysis__in=list(saved.values())).delete()
+
+            labels = []
+            for _, _, match_result in results:
+                labels += match_result['matched_skills'] + match_result['missing_skills']
+            skills = Skill.for_labels(labels)
+
+            entries = []
+            for resume_id, job_id, match_result in results:
+                entries += AnalysisSkill.build_entries(
+                    saved[(resume_id, job_id)], match_result['matched_skills'],
+                    match_result['missing_skills'], skills=skills,
+                )
+            AnalysisSkill.objects.bulk_create(entries, batch_size=batch_size)
+
+        return saved
+
+    def get_skill_lists(self):
+        """Get (matched, missing) skill labels in their original order"""
+        entries = self.skill_entries.all()
+        if not entries and (self.matched_skills or self.missing_skills):
+            # Analyses saved before skill rows existed only have the text columns
+            return (parse_skills_from_string(self.matched_skills),
+                    parse_skills_from_string(self.missing_skills))
+
+        matched_skills = [entry.label for entry in entries if entry.status == AnalysisSkill.MATCHED]
+        missing_skills = [entry.label for entry in entries if entry.status == AnalysisSkill.MISSING]
+        return matched_skills, missing_skills
+
     class Meta:
         ordering = ['-analyzed_at']
         unique_together = ['resume', 'job']
+        indexes = [
+            # Candidates per job ranked by score: job_detail, filter_resumes, analytics
+            models.Index(fields=['job', '-match_score', 'id']),
+            # filter_resumes narrowed to one readiness level
+            models.Index(fields=['job', 'readiness_level', '-match_score']),
+            # Newest analyses first: hr_dashboard and the candidate dashboard
+            models.Index(fields=['-analyzed_at']),
+        ]
+
+
+class Skill(models.Model):
+    name = models.CharField(max_length=255, unique=True)
+
+    def __str__(self):
+        return self.name
+
+    @staticmethod
+    def key_for(label):
+        """Get the canonical skill name a label is stored under"""
+        return normalize_skill(label)[:255]
+
+    @classmethod
+    def for_labels(cls, labels):
+        """Get Skill rows for the given labels keyed by name, creating missing ones"""
+        names = {cls.key_for(label) for label in labels}
+        skills = {skill.name: skill for skill in cls.objects.filter(name__in=names)}
+
+        new_names = names - skills.keys()
+        if new_names:
+            cls.objects.bulk_create([cls(name=name) for name in new_names], ignore_conflicts=True)
+            skills.update({skill.name: skill for skill in cls.objects.filter(name__in=new_names)})
+
+        return skills
+
+    class Meta:
+        ordering = ['name']
+
+
+class AnalysisSkill(models.Model):
+    MATCHED = 'MATCHED'
+    MISSING = 'MISSING'
+    STATUS_CHOICES = [
+        (MATCHED, 'Matched'),
+        (MISSING, 'Missing'),
+    ]
+
+    analysis = models.ForeignKey(SkillAnalysis, on_delete=models.CASCADE, related_name='skill_entries')
+    skill = models.ForeignKey(Skill, on_delete=models.CASCADE, related_name='analysis_entries')
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES)
+    label = models.TextField()
+    position = models.PositiveIntegerField(default=0)
+
+    def __str__(self):
+        return f"{self.analysis_id} - {self.label} ({self.status})"
+
+    @classmethod
+    def build_entries(cls, analysis, matched_skills, missing_skills, skills=None):
+        """Build unsaved skill rows for an analysis, keeping the original order"""
+        labelled = [(label, cls.MATCHED) for label in matched_skills]
+        labelled += [(label, cls.MISSING) for label in missing_skills]
+        if skills is None:
+            skills = Skill.for_labels(label for label, _ in labelled)
+
+        return [
+            cls(
+                analysis=analysis,
+                skill=skills[Skill.key_for(label)],
+                status=status,
+                label=label,
+                position=position,
+            )
+            for position, (label, status) in enumerate(labelled)
+        ]
+
+    @classmethod
+    def top_skills(cls, analyses, status, limit=5):
+        """Get the most frequent (label, count) pairs with a status across analyses"""
+        rows = (
+            cls.objects.filter(analysis__in=analyses, status=status)
+            .values('skill')
+            .annotate(label=Min('label'), count=Count('id'))
+            .order_by('-count', 'label')[:limit]
+        )
+        return [(row['label'], row['count']) for row in rows]
+
+    class Meta:
+        ordering = ['position']
+        indexes = [
+            models.Index(fields=['skill', 'status']),
+        ]
+
+
+class AnalysisTask(models.Model):
+    PENDING = 'PENDING'
+    RUNNING = 'RUNNING'
+    DONE = 'DONE'
+    FAILED = 'FAILED'
+    STATUS_CHOICES = [
+        (PENDING, 'Pending'),
+        (RUNNING, 'Running'),
+        (DONE, 'Done'),
+        (FAILED, 'Failed'),
+    ]
+
+    resume = models.ForeignKey(Resume, on_delete=models.CASCADE)
+    # Tasks without a job only extract the resume's text and skills
+    job = models.ForeignKey(Job, on_delete=models.CASCADE, null=True, blank=True)
+    requested_by = models.ForeignKey(User, on_delete=models.CASCADE, related_name='analysis_tasks')
+    # Groups the tasks of one bulk upload so its progress can be shown per file
+    batch = models.UUIDField(null=True, blank=True, db_index=True)
+    analysis = models.ForeignKey(SkillAnalysis, on_delete=models.SET_NULL, null=True, blank=True)
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default=PENDING)
+    error = models.TextField(blank=True)
+    attempts = models.PositiveSmallIntegerField(default=0)
+    created_at = models.DateTimeField(auto_now_add=True)
+    started_at = models.DateTimeField(null=True, blank=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    def __str__(self):
+        return f"Task {self.id} - {self.resume} ({self.status})"
+
+    @property
+    def is_finished(self):
+        return self.status in (self.DONE, self.FAILED)
+
+    class Meta:
+        ordering = ['created_at']
+        indexes = [
+            models.Index(fields=['status', 'id']),
+        ]
+
+
+class SkillTaxonomyVersion(models.Model):
+    """Snapshot of a skill taxonomy that stored analyses were scored with"""
+    fingerprint = models.CharField(max_length=64, unique=True)
+    predefined_skills = models.JSONField()
+    skill_synonyms = models.JSONField()
+    applied_at = models.DateTimeField(default=timezone.now)
+
+    def __str__(self):
+        return f"{self.fingerprint[:12]} ({self.applied_at:%Y-%m-%d %H:%M})"
+
+    @classmethod
+    def latest(cls):
+        """Get the taxonomy the stored analyses were last re-scored with"""
+        return cls.objects.order_by('-applied_at', '-id').first()
+
+    @classmethod
+    def record_current(cls):
+        """Record that stored analyses are now scored with the current taxonomy"""
+        version, _ = cls.objects.update_or_create(
+            fingerprint=SKILL_TAXONOMY_FINGERPRINT,
+            defaults={
+                'predefined_skills': get_predefined_skills(),
+                'skill_synonyms': get_skill_synonyms(),
+                'applied_at': timezone.now(),
+            },
+        )
+        return version
+
+    def changed_terms(self):
+        """Get the terms whose behaviour differs between this version and the current taxonomy"""
+        return diff_taxonomies(
+            self.predefined_skills, self.skill_synonyms,
+            get_predefined_skills(), get_skill_synonyms(),
+        )
+
+    def affected_analyses(self, chunk_size=1000):
+        """Get analyses whose score may differ under the current taxonomy"""
+        changed_terms = self.changed_terms()
+        if not changed_terms:
+            return SkillAnalysis.objects.none()
+
+        # Jobs are affected when their skill text mentions a changed term.
+        # Re-scoring a job that only mentions one in passing gives the same
+        # score, so the mention is enough.
+        mentions = models.Q()
+        for term in changed_terms:
+            mentions |= models.Q(parsed_skills__icontains=term) | models.Q(required_skills__icontains=term)
+        jobs = Job.objects.filter(mentions)
+
+        # Resumes are affected when their text may contain a changed term, as
+        # told by the term index. Resumes that were never indexed are indexed
+        # first so the index covers them.
+        unindexed = (
+            Resume.objects.with_text().exclude(extracted_text='')
+            .filter(indexed_fingerprint='')
+            .only('id', 'extracted_text')
+        )
+        batch = []
+        for resume in unindexed.iterator(chunk_size=chunk_size):
+            batch.append(resume)
+            if len(batch) >= chunk_size:
+                ResumeTerm.index_resumes(batch)
+                batch = []
+        if batch:
+            ResumeTerm.index_resumes(batch)
+
+        holders = models.Q()
+        for term in changed_terms:
+            holders |= models.Q(resume__in=ResumeTerm.candidate_resumes(term).values('id'))
+
+        return SkillAnalysis.objects.filter(models.Q(job__in=jobs.values('id')) | holders)
+
+    class Meta:
+        ordering = ['-applied_at']
 
 
 class Notification(models.Model):
@@ -90,3 +596,123 @@ class Notification(models.Model):
 
     class Meta:
         ordering = ['-created_at']
+        indexes = [
+            # Unread notifications and their count, newest first
+            models.Index(fields=['user', 'is_read', '-created_at']),
+        ]
+
+
+class ArchivedNotification(models.Model):
+    """Old read notification moved out of the Notification table, with its text compressed"""
+    user = models.ForeignKey(User, on_delete=models.CASCADE)
+    compressed_message = models.BinaryField()
+    created_at = models.DateTimeField()
+    archived_at = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self):
+        return f"{self.user_id} - {self.message[:50]}"
+
+    @property
+    def message(self):
+        return zlib.decompress(self.compressed_message).decode()
+
+    @classmethod
+    def from_notification(cls, notification):
+        return cls(
+            user_id=notification.user_id,
+            compressed_message=zlib.compress(notification.message.encode(), 9),
+            created_at=notification.created_at,
+        )
+
+    class Meta:
+        ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['user', '-created_at']),
+        ]
+
+
+def _per_user(queryset, user_field, aggregate, output_field=None):
+    """Subquery aggregating a user's rows, for use in UserStats updates"""
+    rows = (
+        queryset.filter(**{user_field: OuterRef('user_id')})
+        .order_by()
+        .values(user_field)
+        .annotate(value=aggregate)
+        .values('value')
+    )
+    return Coalesce(Subquery(rows), 0, output_field=output_field or models.IntegerField())
+
+
+class UserStats(models.Model):
+    """Dashboard counters of a user, kept in step with the rows they count.
+
+    Single-row saves and deletes adjust the counters through the signal
+    handlers in signals.py, deleting a job, resume or user recounts the
+    users it touched once, and bulk writes that skip signals adjust or
+    recount the users they touched themselves.
+    """
+    user = models.OneToOneField(User, on_delete=models.CASCADE, primary_key=True, related_name='stats')
+    resume_count = models.IntegerField(default=0)
+    analysis_count = models.IntegerField(default=0)
+    unread_notification_count = models.IntegerField(default=0)
+    # HR users: jobs posted and the analyses scored against them
+    job_count = models.IntegerField(default=0)
+    job_analysis_count = models.IntegerField(default=0)
+    job_score_total = models.FloatField(default=0)
+
+    def __str__(self):
+        return f"Stats for {self.user_id}"
+
+    @property
+    def average_match_score(self):
+        if not self.job_analysis_count:
+            return 0
+        return self.job_score_total / self.job_analysis_count
+
+    @staticmethod
+    def counters():
+        """Expressions computing each counter from scratch"""
+        return {
+            'resume_count': _per_user(Resume.objects.all(), 'user', Count('id')),
+            'analysis_count': _per_user(SkillAnalysis.objects.all(), 'resume__user', Count('id')),
+            'unread_notification_count': _per_user(Notification.objects.filter(is_read=False), 'user', Count('id')),
+            'job_count': _per_user(Job.objects.all(), 'hr', Count('id')),
+            'job_analysis_count': _per_user(SkillAnalysis.objects.all(), 'job__hr', Count('id')),
+            'job_score_total': _per_user(
+                SkillAnalysis.objects.all(), 'job__hr', Sum('match_score'), models.FloatField()
+            ),
+        }
+
+    @classmethod
+    def for_user(cls, user):
+        """Get a user's counters, counting them from scratch the first time"""
+        stats, created = cls.objects.get_or_create(user=user)
+        if created:
+            cls.recount([user.id])
+            stats.refresh_from_db()
+        return stats
+
+    @classmethod
+    def recount(cls, users, fields=None, using=None):
+        """Recompute counters of users (ids or a values queryset) in one UPDATE"""
+        counters = cls.counters()
+        fields = fields or counters.keys()
+        cls.objects.using(using).filter(user__in=users).update(**{field: counters[field] for field in fields})
+
+    @classmethod
+    def adjust(cls, users, using=None, **deltas):
+        """Add deltas to counters of users (ids or a values queryset) that have a stats row"""
+        cls.objects.using(using).filter(user__in=users).update(
+            **{field: F(field) + delta for field, delta in deltas.items()}
+        )
+
+    @classmethod
+    def adjust_each(cls, deltas_by_user, using=None):
+        """Add each user's own deltas ({user_id: {field: delta}}), one UPDATE per distinct set of deltas"""
+        users_by_deltas = {}
+        for user, deltas in deltas_by_user.items():
+            deltas = tuple(sorted((field, delta) for field, delta in deltas.items() if delta))
+            if deltas:
+                users_by_deltas.setdefault(deltas, []).append(user)
+        for deltas, users in users_by_deltas.items():
+            cls.adjust(users, using=using, **dict(deltas))
@@ -0,0 +1,149 @@
+import base64
+import binascii
+import json
+
+from django.core.exceptions import ValidationError
+from django.db.models import Q
+
+
+class CursorPage:
+    """One page of a CursorPaginator, usable like a Django Page in templates"""
+
+    def __init__(self, object_list, paginator, next_cursor=None, previous_cursor=None):
+        self.object_list = object_list
+        self.paginator = paginator
+        self.next_cursor = next_cursor
+        self.previous_cursor = previous_cursor
+        # Other query parameters to carry over into page links
+        self.query_string = ''
+
+    def __iter__(self):
+        return iter(self.object_list)
+
+    def __len__(self):
+        return len(self.object_list)
+
+    def __getitem__(self, index):
+        return self.object_list[index]
+
+    def has_next(self):
+        return self.next_cursor is not None
+
+    def has_previous(self):
+        return self.previous_cursor is not None
+
+    def has_other_pages(self):
+        return self.has_next() or self.has_previous()
+
+    def as_dict(self, results):
+        """Pagination metadata around already-serialized results, for JSON responses"""
+        data = {
+            'results': results,
+            'next_cursor': self.next_cursor,
+            'previous_cursor': self.previous_cursor,
+        }
+        if self.paginator.count_limit:
+            data['count'] = self.paginator.count
+            data['count_is_exact'] = self.paginator.count_is_exact
+        return data
+
+
+class CursorPaginator:
+    """Keyset pagination over a queryset.
+
+    Pages are addressed by an opaque cursor holding the ordering values of the
+    row at the page edge, so every page is one indexed range query no matter
+    how deep it is. `ordering` must end with a unique field such as id.
+    Counting is optional: with `count_limit` set, `count` stops at that many
+    rows and `count_is_exact` says whether the real total is larger.
+    """
+
+    def __init__(self, queryset, per_page, ordering=('-id',), count_limit=None):
+        self.queryset = queryset
+        self.per_page = per_page
+        self.ordering = list(ordering)
+        self.count_limit = count_limit
+        self.fields = [
+            queryset.model._meta.get_field(name.lstrip('-'))
+            for name in self.ordering
+        ]
+        self._count = None
+
+    @property
+    def count(self):
+        if self._count is None:
+            self._count = self.queryset[:self.count_limit].count()
+        return self._count
+
+    @property
+    def count_is_exact(self):
+        return self.count_limit is None or self.count < self.count_limit
+
+    def get_page(self, cursor=None):
+        """Return the page after (or before) a cursor; bad cursors give the first page"""
+        position = self.decode_cursor(cursor) if cursor else None
+        backwards = position is not None and position[0] == 'p'
+
+        ordering = [self.reverse(name) for name in self.ordering] if backwards else self.ordering
+        queryset = self.queryset.order_by(*ordering)
+        if position is not None:
+            queryset = queryset.filter(self.after(ordering, position[1]))
+
+        rows = list(queryset[:self.per_page + 1])
+        more = len(rows) > self.per_page
+        rows = rows[:self.per_page]
+        if backwards:
+            rows.reverse()
+
+        if not rows:
+            # The rows around a stale cursor may be gone; start over
+            return self.get_page() if position is not None else CursorPage(rows, self)
+
+        has_next = more if not backwards else True
+        has_previous = position is not None if not backwards else more
+        return CursorPage(
+            rows,
+            self,
+            next_cursor=self.encode_cursor('n', rows[-1]) if has_next else None,
+            previous_cursor=self.encode_cursor('p', rows[0]) if has_previous else None,
+        )
+
+    def after(self, ordering, values):
+        """Filter for rows strictly after `values` in `ordering`"""
+        condition = Q()
+        equal = Q()
+        for name, field, value in zip(ordering, self.fields, values):
+            lookup = 'lt' if name.startswith('-') else 'gt'
+            condition |= equal & Q(**{f'{field.name}__{lookup}': value})
+            equal &= Q(**{field.name: value})
+        return condition
+
+    def encode_cursor(self, direction, row):
+        # Dates keep full precision so no row is skipped at a page edge
+        values = [getattr(row, field.attname) for field in self.fields]
+        values = [value.isoformat() if hasattr(value, 'isoformat') else value for value in values]
+        payload = json.dumps([direction, values])
+        return base64.urlsafe_b64encode(payload.encode()).decode()
+
+    def decode_cursor(self, cursor):
+        try:
+            direction, values = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+            if direction not in ('n', 'p') or len(values) != len(self.fields):
+                return None
+            return direction, [field.to_python(value) for field, value in zip(self.fields, values)]
+        except (ValueError, TypeError, binascii.Error, ValidationError):
+            return None
+
+    @staticmethod
+    def reverse(name):
+        return name[1:] if name.startswith('-') else f'-{name}'
+
+
+def paginate(request, queryset, per_page, ordering, count_limit=None):
+    """Cursor-paginate a queryset from the request's ?cursor= parameter"""
+    page = CursorPaginator(queryset, per_page, ordering, count_limit).get_page(request.GET.get('cursor'))
+    params = request.GET.copy()
+    for name in ('cursor', 'page', 'format'):
+        params.pop(name, None)
+    page.query_string = params.urlencode()
+    return page
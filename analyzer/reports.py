@@ -0,0 +1,273 @@
+import csv
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import zipfile
+
+from django.conf import settings
+from django.utils.text import slugify
+from reportlab.lib import colors
+from reportlab.lib.pagesizes import letter
+from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+from reportlab.lib.units import inch
+from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle
+
+from .utils import format_skills_list, get_skill_suggestions
+
+# Analyses loaded per query while streaming a bulk export
+EXPORT_CHUNK_SIZE = 500
+
+EXPORT_FIELDS = [
+    'id', 'candidate', 'email', 'job_title', 'match_score', 'gap_percentage',
+    'readiness_level', 'matched_skills', 'missing_skills', 'analyzed_at',
+]
+
+
+def candidate_name(analysis):
+    user = analysis.resume.user
+    return user.get_full_name() or user.username
+
+
+def report_version(analysis):
+    """Version of an analysis report that its cache entry and ETag are keyed on.
+
+    The analysis's updated_at changes whenever it is re-scored. The candidate
+    name and job title live on other rows, so a digest of them is added.
+    """
+    names = f'{candidate_name(analysis)}\n{analysis.job.title}'
+    digest = hashlib.sha256(names.encode()).hexdigest()[:12]
+    return f'{analysis.updated_at:%Y%m%d%H%M%S%f}-{digest}'
+
+
+def report_path(analysis):
+    """Where the cached PDF report of an analysis's current version lives"""
+    return os.path.join(settings.REPORT_CACHE_DIR, str(analysis.id), f'{report_version(analysis)}.pdf')
+
+
+def report_data(analysis):
+    """Plain data a report is rendered from, so rendering can run in a worker process"""
+    matched_skills, missing_skills = analysis.get_skill_lists()
+    return {
+        'candidate': candidate_name(analysis),
+        'job_title': analysis.job.title,
+        'match_score': analysis.match_score,
+        'gap_percentage': analysis.gap_percentage,
+        'readiness_level': analysis.get_readiness_level_display(),
+        'analyzed_at': analysis.analyzed_at.strftime('%Y-%m-%d %H:%M'),
+        'matched_skills': matched_skills,
+        'missing_skills': missing_skills,
+    }
+
+
+def build_report_pdf(output, data):
+    """Write the skill gap report PDF for report_data() output to a file-like object"""
+    doc = SimpleDocTemplate(output, pagesize=letter)
+    styles = getSampleStyleSheet()
+    story = []
+
+    # Title
+    title_style = ParagraphStyle(
+        'CustomTitle',
+        parent=styles['Heading1'],
+        fontSize=18,
+        spaceAfter=30,
+    )
+    story.append(Paragraph("Skill Gap Analysis Report", title_style))
+    story.append(Spacer(1, 12))
+
+    # Basic info
+    info_data = [
+        ['Candidate:', data['candidate']],
+        ['Job Title:', data['job_title']],
+        ['Match Score:', f"{data['match_score']}%"],
+        ['Gap Percentage:', f"{data['gap_percentage']}%"],
+        ['Readiness Level:', data['readiness_level']],
+        ['Analysis Date:', data['analyzed_at']],
+    ]
+
+    info_table = Table(info_data, colWidths=[2*inch, 4*inch])
+    info_table.setStyle(TableStyle([
+        ('BACKGROUND', (0, 0), (0, -1), colors.grey),
+        ('TEXTCOLOR', (0, 0), (0, -1), colors.whitesmoke),
+        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+        ('FONTNAME', (0, 0), (-1, -1), 'Helvetica'),
+        ('FONTSIZE', (0, 0), (-1, -1), 10),
+        ('BOTTOMPADDING', (0, 0), (-1, -1), 12),
+        ('BACKGROUND', (1, 0), (1, -1), colors.beige),
+        ('GRID', (0, 0), (-1, -1), 1, colors.black)
+    ]))
+
+    story.append(info_table)
+    story.append(Spacer(1, 20))
+
+    # Skills sections
+    matched_skills = data['matched_skills']
+    missing_skills = data['missing_skills']
+
+    if matched_skills:
+        story.append(Paragraph("Matched Skills:", styles['Heading2']))
+        for skill in matched_skills:
+            story.append(Paragraph(f"• {skill}", styles['Normal']))
+        story.append(Spacer(1, 12))
+
+    if missing_skills:
+        story.append(Paragraph("Missing Skills:", styles['Heading2']))
+        for skill in missing_skills:
+            story.append(Paragraph(f"• {skill}", styles['Normal']))
+        story.append(Spacer(1, 12))
+
+    # Suggestions
+    suggestions = get_skill_suggestions(missing_skills, matched_skills)
+    if suggestions:
+        story.append(Paragraph("Improvement Suggestions:", styles['Heading2']))
+        for suggestion in suggestions:
+            story.append(Paragraph(f"• {suggestion}", styles['Normal']))
+
+    doc.build(story)
+
+
+def render_report(item):
+    """Render a (path, data) pair into the cache and drop older versions of the report.
+
+    Runs in a worker process in batch mode, so it only takes plain data.
+    """
+    path, data = item
+    directory = os.path.dirname(path)
+    os.makedirs(directory, exist_ok=True)
+
+    # Render next to the target and rename, so readers never see a partial file
+    fd, temp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            build_report_pdf(f, data)
+        os.replace(temp_path, path)
+    except BaseException:
+        os.remove(temp_path)
+        raise
+
+    for name in os.listdir(directory):
+        old_path = os.path.join(directory, name)
+        if old_path != path and name.endswith('.pdf'):
+            try:
+                os.remove(old_path)
+            except OSError:
+                pass
+    return path
+
+
+def get_report(analysis):
+    """Open an analysis's PDF report for reading, rendering it on a cache miss.
+
+    The file is opened rather than checked for, because rendering a newer
+    version of the report can remove it at any moment; an open file stays
+    readable after it is removed.
+    """
+    path = report_path(analysis)
+    try:
+        return open(path, 'rb')
+    except FileNotFoundError:
+        render_report((path, report_data(analysis)))
+        return open(path, 'rb')
+
+
+def render_reports(analyses, executor=None):
+    """Make sure the reports of many analyses are cached, rendering in the pool when one is given.
+
+    Returns report paths keyed by analysis id. Analyses should come with
+    resume__user, job and skill_entries loaded.
+    """
+    paths = {}
+    missing = []
+    for analysis in analyses:
+        path = paths[analysis.id] = report_path(analysis)
+        if not os.path.exists(path):
+            missing.append((path, report_data(analysis)))
+
+    if executor is not None and len(missing) > 1:
+        list(executor.map(render_report, missing))
+    else:
+        for item in missing:
+            render_report(item)
+    return paths
+
+
+def export_row(analysis):
+    """One analysis as plain data for the CSV and JSON Lines exports"""
+    matched_skills, missing_skills = analysis.get_skill_lists()
+    return {
+        'id': analysis.id,
+        'candidate': candidate_name(analysis),
+        'email': analysis.resume.user.email,
+        'job_title': analysis.job.title,
+        'match_score': analysis.match_score,
+        'gap_percentage': analysis.gap_percentage,
+        'readiness_level': analysis.get_readiness_level_display(),
+        'matched_skills': matched_skills,
+        'missing_skills': missing_skills,
+        'analyzed_at': analysis.analyzed_at.isoformat(),
+    }
+
+
+class _Echo:
+    """File-like object handing back what csv.writer writes, so rows can be yielded"""
+
+    def write(self, value):
+        return value
+
+
+def stream_csv(analyses):
+    """Yield a CSV export of analyses line by line"""
+    writer = csv.writer(_Echo())
+    yield writer.writerow(EXPORT_FIELDS)
+    for analysis in analyses:
+        row = export_row(analysis)
+        row['matched_skills'] = format_skills_list(row['matched_skills'])
+        row['missing_skills'] = format_skills_list(row['missing_skills'])
+        yield writer.writerow([row[field] for field in EXPORT_FIELDS])
+
+
+def stream_jsonl(analyses):
+    """Yield a JSON Lines export of analyses, one object per line"""
+    for analysis in analyses:
+        yield json.dumps(export_row(analysis)) + '\n'
+
+
+class _ZipBuffer:
+    """Write-only file object holding zipfile output until it is drained.
+
+    It cannot seek, so zipfile writes each entry's sizes after its data and
+    the archive can be sent while it is being built.
+    """
+
+    def __init__(self):
+        self.chunks = []
+
+    def write(self, data):
+        self.chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self):
+        pass
+
+    def drain(self):
+        data = b''.join(self.chunks)
+        self.chunks = []
+        return data
+
+
+def stream_report_zip(analyses):
+    """Yield a ZIP archive of the analyses' PDF reports one entry at a time"""
+    buffer = _ZipBuffer()
+    with zipfile.ZipFile(buffer, 'w', zipfile.ZIP_DEFLATED) as archive:
+        for analysis in analyses:
+            info = zipfile.ZipInfo(
+                f'analysis_{analysis.id}_{slugify(candidate_name(analysis))}.pdf',
+                date_time=analysis.updated_at.timetuple()[:6],
+            )
+            info.compress_type = zipfile.ZIP_DEFLATED
+            with get_report(analysis) as report, archive.open(info, 'w') as entry:
+                shutil.copyfileobj(report, entry)
+            yield buffer.drain()
+    yield buffer.drain()
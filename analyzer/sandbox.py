@@ -0,0 +1,75 @@
+import multiprocessing
+
+try:
+    import resource
+except ImportError:  # Not available on Windows
+    resource = None
+
+from django.conf import settings
+
+from .utils import ExtractionError, scan_resume_file
+
+
+def _extract_in_child(conn, file_path, file_name, memory_limit):
+    """Child process body: cap the address space, parse, and report back over the pipe"""
+    if resource is not None and memory_limit:
+        resource.setrlimit(resource.RLIMIT_AS, (memory_limit, memory_limit))
+
+    try:
+        try:
+            message = ('ok', scan_resume_file(file_path, file_name))
+        except ExtractionError as e:
+            message = ('error', (e.status, str(e)))
+        except MemoryError:
+            message = ('error', (ExtractionError.MEMORY, 'Document needs more memory than the extraction limit allows.'))
+        except Exception as e:
+            message = ('error', (ExtractionError.INVALID, str(e)))
+        # Sent once the handlers are left: until then the traceback keeps the
+        # parser's frames, and the memory they hold, alive
+        conn.send(message)
+    finally:
+        conn.close()
+
+
+def extract_resume(file_path, file_name, timeout=None, memory_limit=None):
+    """Extract a resume's text and skills in a child process with time and memory limits.
+
+    Returns (text, skills). Raises ExtractionError when the file cannot be
+    parsed, runs past `timeout` seconds, needs more than `memory_limit` bytes,
+    or takes the child process down with it.
+    """
+    if timeout is None:
+        timeout = settings.RESUME_EXTRACTION_TIMEOUT
+    if memory_limit is None:
+        memory_limit = settings.RESUME_EXTRACTION_MEMORY_MB * 1024 * 1024
+
+    receiver, sender = multiprocessing.Pipe(duplex=False)
+    process = multiprocessing.Process(
+        target=_extract_in_child,
+        args=(sender, file_path, file_name, memory_limit),
+        daemon=True,
+    )
+    process.start()
+    sender.close()
+
+    try:
+        if not receiver.poll(timeout):
+            raise ExtractionError(ExtractionError.TIMEOUT, f'Extraction took longer than {timeout} seconds.')
+        try:
+            kind, value = receiver.recv()
+        except EOFError:
+            # The child died without reporting, e.g. killed by the kernel
+            process.join()
+            raise ExtractionError(
+                ExtractionError.CRASHED, f'Extraction process exited with code {process.exitcode}.'
+            )
+    finally:
+        if process.is_alive():
+            process.kill()
+        process.join()
+        receiver.close()
+
+    if kind == 'error':
+        status, message = value
+        raise ExtractionError(status, message)
+    return value
@@ -0,0 +1,148 @@
+from django.contrib.auth.models import User
+from django.db.models import Q, QuerySet
+from django.db.models.signals import post_delete, post_save, pre_delete, pre_save
+from django.dispatch import receiver
+
+from .models import Job, Notification, Resume, SkillAnalysis, UserStats
+
+# Deleting one of these cascades to rows counted for other users. The
+# handlers of the cascaded rows do nothing, and each deleted root row
+# recounts the users it affected once the cascade is done.
+CASCADE_ROOTS = (Job, Resume, User)
+
+
+def _resume_owner(analysis):
+    return Resume.objects.filter(id=analysis.resume_id).values('user')
+
+
+def _job_owner(analysis):
+    return Job.objects.filter(id=analysis.job_id).values('hr')
+
+
+def _origin_model(origin):
+    """Model of the instance or queryset a delete was started from (origin is None before Django 4.1)"""
+    return origin.model if isinstance(origin, QuerySet) else type(origin)
+
+
+def _is_cascade_root(sender, origin):
+    return issubclass(sender, CASCADE_ROOTS) and issubclass(_origin_model(origin), sender)
+
+
+def _is_cascaded(sender, origin):
+    model = _origin_model(origin)
+    return issubclass(model, CASCADE_ROOTS) and not issubclass(sender, model)
+
+
+def _counted_per_row(sender, origin):
+    return not _is_cascade_root(sender, origin) and not _is_cascaded(sender, origin)
+
+
+def _affected_users(instance, using):
+    """Ids of the users whose counters deleting a job, resume or user changes"""
+    analyses = SkillAnalysis.objects.using(using)
+    if isinstance(instance, Job):
+        users = {instance.hr_id}
+        analyses = analyses.filter(job=instance)
+    elif isinstance(instance, Resume):
+        users = {instance.user_id}
+        analyses = analyses.filter(resume=instance)
+    else:
+        users = set()
+        analyses = analyses.filter(Q(resume__user=instance) | Q(job__hr=instance))
+
+    for resume_owner, job_owner in analyses.values_list('resume__user', 'job__hr').distinct():
+        users.update((resume_owner, job_owner))
+    # A deleted user's own counters go with it
+    users.discard(instance.pk if isinstance(instance, User) else None)
+    return list(users)
+
+
+@receiver(pre_delete, sender=Job)
+@receiver(pre_delete, sender=Resume)
+@receiver(pre_delete, sender=User)
+def cascade_started(sender, instance, using, origin=None, **kwargs):
+    if _is_cascade_root(sender, origin):
+        # The analyses linking the affected users are gone after the cascade
+        instance._stats_users = _affected_users(instance, using)
+
+
+@receiver(post_delete, sender=Job)
+@receiver(post_delete, sender=Resume)
+@receiver(post_delete, sender=User)
+def cascade_finished(sender, instance, using, origin=None, **kwargs):
+    if _is_cascade_root(sender, origin):
+        UserStats.recount(instance._stats_users, using=using)
+
+
+@receiver(post_save, sender=Resume)
+def resume_saved(sender, instance, created, using, **kwargs):
+    if created:
+        UserStats.adjust([instance.user_id], using=using, resume_count=1)
+
+
+@receiver(post_delete, sender=Resume)
+def resume_deleted(sender, instance, using, origin=None, **kwargs):
+    if _counted_per_row(sender, origin):
+        UserStats.adjust([instance.user_id], using=using, resume_count=-1)
+
+
+@receiver(post_save, sender=Job)
+def job_saved(sender, instance, created, using, **kwargs):
+    if created:
+        UserStats.adjust([instance.hr_id], using=using, job_count=1)
+
+
+@receiver(post_delete, sender=Job)
+def job_deleted(sender, instance, using, origin=None, **kwargs):
+    if _counted_per_row(sender, origin):
+        UserStats.adjust([instance.hr_id], using=using, job_count=-1)
+
+
+def _score_saved(update_fields):
+    return update_fields is None or 'match_score' in update_fields
+
+
+@receiver(pre_save, sender=SkillAnalysis)
+def analysis_saving(sender, instance, using, update_fields=None, **kwargs):
+    # The save replaces the stored score, which the job owner's total includes
+    instance._stored_match_score = None
+    if instance.pk is not None and _score_saved(update_fields):
+        instance._stored_match_score = (
+            SkillAnalysis.objects.using(using).filter(pk=instance.pk)
+            .values_list('match_score', flat=True).first()
+        )
+
+
+@receiver(post_save, sender=SkillAnalysis)
+def analysis_saved(sender, instance, created, using, **kwargs):
+    stored_score = getattr(instance, '_stored_match_score', None)
+    if created:
+        UserStats.adjust(_resume_owner(instance), using=using, analysis_count=1)
+        UserStats.adjust(_job_owner(instance), using=using,
+                         job_analysis_count=1, job_score_total=instance.match_score)
+    elif stored_score is not None and instance.match_score != stored_score:
+        UserStats.adjust(_job_owner(instance), using=using,
+                         job_score_total=instance.match_score - stored_score)
+
+
+@receiver(post_delete, sender=SkillAnalysis)
+def analysis_deleted(sender, instance, using, origin=None, **kwargs):
+    if _counted_per_row(sender, origin):
+        UserStats.adjust(_resume_owner(instance), using=using, analysis_count=-1)
+        UserStats.adjust(_job_owner(instance), using=using,
+                         job_analysis_count=-1, job_score_total=-instance.match_score)
+
+
+@receiver(post_save, sender=Notification)
+def notification_saved(sender, instance, created, using, update_fields, **kwargs):
+    if created:
+        if not instance.is_read:
+            UserStats.adjust([instance.user_id], using=using, unread_notification_count=1)
+    elif update_fields is None or 'is_read' in update_fields:
+        UserStats.recount([instance.user_id], ['unread_notification_count'], using=using)
+
+
+@receiver(post_delete, sender=Notification)
+def notification_deleted(sender, instance, using, origin=None, **kwargs):
+    if not instance.is_read and _counted_per_row(sender, origin):
+        UserStats.adjust([instance.user_id], using=using, unread_notification_count=-1)
@@ -368,6 +368,23 @@ function showToast(message, type = 'info') {
     });
 }
 
+// Live unread notification count pushed by the server
+document.addEventListener('DOMContentLoaded', function() {
+    var link = document.querySelector('[data-notification-stream]');
+    if (!link || !window.EventSource) return;
+
+    var badge = link.querySelector('[data-unread-count]');
+    var source = new EventSource(link.dataset.notificationStream);
+    source.addEventListener('unread', function(event) {
+        var unread = JSON.parse(event.data).unread;
+        badge.textContent = unread;
+        badge.hidden = unread === 0;
+    });
+    source.addEventListener('notification', function() {
+        showToast('You have a new notification.', 'info');
+    });
+});
+
 function formatFileSize(bytes) {
     if (bytes === 0) return '0 Bytes';
     var k = 1024;
@@ -0,0 +1,95 @@
+import asyncio
+import json
+import time
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.contrib.auth import get_user
+from django.core.handlers.asgi import ASGIRequest
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import HttpResponse, JsonResponse, StreamingHttpResponse
+
+from .models import Notification, UserStats
+
+
+def _latest_notification_id(user):
+    return Notification.objects.filter(user=user).order_by('-id').values_list('id', flat=True).first() or 0
+
+
+def _new_notifications(user, last_id, limit=50):
+    return list(
+        Notification.objects.filter(user=user, id__gt=last_id)
+        .order_by('id')
+        .values('id', 'message', 'is_read', 'created_at')[:limit]
+    )
+
+
+def _unread_count(user):
+    return UserStats.for_user(user).unread_notification_count
+
+
+def _event(name, data, event_id=None):
+    lines = [f'id: {event_id}'] if event_id is not None else []
+    lines += [f'event: {name}', f'data: {json.dumps(data, cls=DjangoJSONEncoder)}']
+    return '\n'.join(lines) + '\n\n'
+
+
+async def _notification_events(user, last_id, once):
+    """Yield server-sent events for new notifications and unread count changes.
+
+    Each tick costs one primary key lookup and one indexed range query. The
+    stream ends after NOTIFICATION_STREAM_SECONDS and the browser reconnects,
+    resuming from the Last-Event-ID it was sent. A single round (once=True)
+    asks the browser to wait NOTIFICATION_WSGI_RETRY_SECONDS before the next.
+    """
+    poll_seconds = settings.NOTIFICATION_POLL_SECONDS
+    deadline = time.monotonic() + settings.NOTIFICATION_STREAM_SECONDS
+    unread = None
+
+    retry_seconds = settings.NOTIFICATION_WSGI_RETRY_SECONDS if once else poll_seconds
+    yield f'retry: {retry_seconds * 1000}\n\n'
+    while True:
+        for notification in await sync_to_async(_new_notifications)(user, last_id):
+            last_id = notification['id']
+            yield _event('notification', notification, event_id=last_id)
+
+        count = await sync_to_async(_unread_count)(user)
+        if count != unread:
+            unread = count
+            yield _event('unread', {'unread': unread})
+
+        if once or time.monotonic() >= deadline:
+            return
+        await asyncio.sleep(poll_seconds)
+        # Comment lines keep proxies from closing an idle connection
+        yield ': ping\n\n'
+
+
+async def notification_stream(request):
+    """Push new notifications and the unread count as server-sent events.
+
+    Needs an ASGI server (see resume_skill_gap/asgi.py) to hold the
+    connection open. Under WSGI each request sends one round of events and
+    the browser reconnects after NOTIFICATION_WSGI_RETRY_SECONDS, which
+    amounts to slow polling.
+    """
+    user = await sync_to_async(get_user)(request)
+    if not user.is_authenticated:
+        return JsonResponse({'error': 'Authentication required.'}, status=401)
+
+    last_event_id = request.headers.get('Last-Event-ID', '')
+    if last_event_id.isdigit():
+        last_id = int(last_event_id)
+    else:
+        # A new stream starts from now instead of replaying old notifications
+        last_id = await sync_to_async(_latest_notification_id)(user)
+
+    if isinstance(request, ASGIRequest):
+        response = StreamingHttpResponse(_notification_events(user, last_id, once=False),
+                                         content_type='text/event-stream')
+    else:
+        events = [event async for event in _notification_events(user, last_id, once=True)]
+        response = HttpResponse(''.join(events), content_type='text/event-stream')
+    response['Cache-Control'] = 'no-cache'
+    response['X-Accel-Buffering'] = 'no'
+    return response
@@ -0,0 +1,218 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.db.models import F
+from django.utils import timezone
+
+from .models import AnalysisTask, Resume, ResumeTerm, SkillAnalysis
+from .sandbox import extract_resume
+from .utils import (
+    ExtractionError, extract_skills_from_text, get_skills_fingerprint,
+    calculate_skill_match_for_jobs
+)
+
+
+def enqueue_analysis(resume, requested_by, job=None, batch=None):
+    """Queue text extraction for a resume, and its analysis against a job if given"""
+    task = AnalysisTask.objects.create(resume=resume, job=job, requested_by=requested_by, batch=batch)
+
+    # Without background workers the task runs inside the request, as before
+    if not settings.ANALYSIS_BACKGROUND:
+        run_tasks([task])
+
+    return task
+
+
+def claim_tasks(limit=1):
+    """Atomically claim up to `limit` pending tasks for this worker"""
+    claimed_ids = []
+    candidate_ids = (
+        AnalysisTask.objects.filter(status=AnalysisTask.PENDING)
+        .order_by('id')
+        .values_list('id', flat=True)[:limit * 2]
+    )
+
+    for task_id in candidate_ids:
+        # The conditional update only succeeds for one worker per task
+        claimed = AnalysisTask.objects.filter(id=task_id, status=AnalysisTask.PENDING).update(
+            status=AnalysisTask.RUNNING,
+            started_at=timezone.now(),
+            attempts=F('attempts') + 1,
+        )
+        if claimed:
+            claimed_ids.append(task_id)
+            if len(claimed_ids) >= limit:
+                break
+
+    return list(AnalysisTask.objects.filter(id__in=claimed_ids).select_related('resume', 'job'))
+
+
+def requeue_stale_tasks(stale_after, max_attempts):
+    """Return tasks left running by a dead worker to the queue, failing repeat offenders"""
+    cutoff = timezone.now() - timedelta(seconds=stale_after)
+    stale = AnalysisTask.objects.filter(status=AnalysisTask.RUNNING, started_at__lt=cutoff)
+
+    failed = stale.filter(attempts__gte=max_attempts).update(
+        status=AnalysisTask.FAILED,
+        error='Task did not finish after repeated attempts.',
+        finished_at=timezone.now(),
+    )
+    requeued = stale.update(status=AnalysisTask.PENDING, started_at=None)
+    return requeued, failed
+
+
+def analyze_resume_payload(payload):
+    """Extract and score one resume against its jobs.
+
+    Runs in a worker process, so it only takes and returns plain data.
+    """
+    result = {'resume_id': payload['resume_id'], 'match_results': {}, 'error': ''}
+
+    # A file that already failed to parse is not parsed again
+    if payload['extraction_failed']:
+        result['error'] = payload['extraction_error']
+        return result
+
+    try:
+        # Text and skills are only sent back when they had to be recomputed
+        extracted_text = payload['extracted_text']
+        extracted_skills = payload['extracted_skills']
+        # A file whose extraction succeeded with no text (e.g. a scanned
+        # image) is not parsed again either
+        if payload['extraction_pending']:
+            extracted_text, extracted_skills = extract_resume(payload['file_path'], payload['file_name'])
+            result['extraction_status'] = Resume.EXTRACTION_OK
+            result['extracted_text'] = extracted_text
+            result['extracted_skills'] = extracted_skills
+            result['skills_fingerprint'] = get_skills_fingerprint(extracted_text)
+        else:
+            fingerprint = get_skills_fingerprint(extracted_text)
+            if fingerprint != payload['skills_fingerprint']:
+                extracted_skills = extract_skills_from_text(extracted_text)
+                result['extracted_skills'] = extracted_skills
+                result['skills_fingerprint'] = fingerprint
+
+        job_ids = [job_id for job_id, _ in payload['jobs']]
+        match_results = calculate_skill_match_for_jobs(
+            extracted_skills, [job_skills for _, job_skills in payload['jobs']]
+        )
+
+        result['match_results'] = dict(zip(job_ids, match_results))
+    except ExtractionError as e:
+        result['extraction_status'] = e.status
+        result['error'] = str(e)
+    except Exception as e:
+        result['error'] = str(e)
+    return result
+
+
+def build_resume_payloads(items):
+    """Group tasks or analyses by resume so each resume is extracted once per batch"""
+    payloads = {}
+    for item in items:
+        resume = item.resume
+        payload = payloads.get(resume.id)
+        if payload is None:
+            payload = payloads[resume.id] = {
+                'resume_id': resume.id,
+                'file_path': resume.resume_file.path,
+                'file_name': resume.resume_file.name,
+                'extracted_text': resume.extracted_text,
+                'extracted_skills': resume.extracted_skills,
+                'skills_fingerprint': resume.skills_fingerprint,
+                'extraction_pending': resume.extraction_status == Resume.EXTRACTION_PENDING,
+                'extraction_failed': resume.extraction_failed,
+                'extraction_error': resume.extraction_error,
+                'jobs': [],
+            }
+        if item.job_id and item.job_id not in dict(payload['jobs']):
+            payload['jobs'].append((item.job_id, item.job.get_required_skills()))
+    return list(payloads.values())
+
+
+def map_payloads(payloads, executor=None):
+    """Run analyze_resume_payload over payloads, in the pool when one is given"""
+    if executor is not None and len(payloads) > 1:
+        return executor.map(analyze_resume_payload, payloads)
+    return map(analyze_resume_payload, payloads)
+
+
+def run_tasks(tasks, executor=None, on_result=None):
+    """Run a batch of tasks, optionally spreading extraction over a process pool.
+
+    Results are written back with bulk queries once the whole batch is done.
+    `on_result` is called with each resume's result as soon as it is ready.
+    """
+    tasks = list(tasks)
+    payloads = build_resume_payloads(tasks)
+
+    results_by_resume = {}
+    for result in map_payloads(payloads, executor):
+        results_by_resume[result['resume_id']] = result
+        if on_result:
+            on_result(result)
+
+    try:
+        save_task_results(tasks, results_by_resume)
+    except Exception as e:
+        for task in tasks:
+            task.status = AnalysisTask.FAILED
+            task.error = str(e)
+
+    finished_at = timezone.now()
+    for task in tasks:
+        task.finished_at = finished_at
+    AnalysisTask.objects.bulk_update(tasks, ['status', 'error', 'analysis', 'finished_at'])
+    return tasks
+
+
+def save_resume_results(results_by_resume):
+    """Bulk-write resume text, skills and analyses from analyze_resume_payload results.
+
+    Returns the saved analyses keyed by (resume_id, job_id).
+    """
+    new_statuses = []
+    new_texts = []
+    new_skills = []
+    match_results = []
+    for result in results_by_resume.values():
+        if 'extraction_status' in result:
+            new_statuses.append(Resume(
+                id=result['resume_id'],
+                extraction_status=result['extraction_status'],
+                extraction_error=result['error'],
+            ))
+        if result['error']:
+            continue
+        if 'extracted_text' in result:
+            new_texts.append(Resume(id=result['resume_id'], extracted_text=result['extracted_text']))
+        if 'extracted_skills' in result:
+            new_skills.append(Resume(
+                id=result['resume_id'],
+                extracted_skills=result['extracted_skills'],
+                skills_fingerprint=result['skills_fingerprint'],
+            ))
+        for job_id, match_result in result['match_results'].items():
+            match_results.append((result['resume_id'], job_id, match_result))
+
+    Resume.objects.bulk_update(new_statuses, ['extraction_status', 'extraction_error'])
+    Resume.objects.bulk_update(new_texts, ['extracted_text'])
+    ResumeTerm.index_resumes(new_texts)
+    Resume.objects.bulk_update(new_skills, ['extracted_skills', 'skills_fingerprint'])
+    return SkillAnalysis.bulk_apply_match_results(match_results)
+
+
+def save_task_results(tasks, results_by_resume):
+    """Save a batch's results, then mark each task done or failed"""
+    analyses = save_resume_results(results_by_resume)
+
+    for task in tasks:
+        result = results_by_resume[task.resume_id]
+        if result['error']:
+            task.status = AnalysisTask.FAILED
+            task.error = result['error']
+            continue
+        task.status = AnalysisTask.DONE
+        task.error = ''
+        if task.job_id:
+            task.analysis = analyses[(task.resume_id, task.job_id)]
@@ -0,0 +1,16 @@
+import tempfile
+
+from django.test import TestCase, override_settings
+
+
+class TempMediaTestCase(TestCase):
+    """Test case whose uploads go to a scratch media directory"""
+
+    @classmethod
+    def setUpClass(cls):
+        media_root = tempfile.TemporaryDirectory()
+        cls.addClassCleanup(media_root.cleanup)
+        media_settings = override_settings(MEDIA_ROOT=media_root.name)
+        media_settings.enable()
+        cls.addClassCleanup(media_settings.disable)
+        super().setUpClass()
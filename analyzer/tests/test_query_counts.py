@@ -0,0 +1,120 @@
+from django.contrib.auth.models import User
+from django.core.files.base import ContentFile
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from analyzer.models import Job, Notification, Resume, SkillAnalysis, UserProfile, UserStats
+from analyzer.tests.base import TempMediaTestCase
+from analyzer.utils import calculate_skill_match
+
+# Most queries each page may run, whatever the amount of data
+QUERY_BUDGETS = [
+    ('hr', 'hr_dashboard', 7),
+    ('hr', 'analytics', 8),
+    ('hr', 'filter_resumes', 6),
+    ('hr', 'job_list', 5),
+    ('hr', 'job_detail', 6),
+    ('hr', 'candidate_detail', 9),
+    ('hr', 'candidate_view', 11),
+    ('candidate', 'dashboard', 9),
+    ('candidate', 'resume_history', 5),
+    ('candidate', 'notifications', 5),
+    ('candidate', 'available_jobs', 5),
+    ('candidate', 'analysis_result', 9),
+]
+
+SKILL_SETS = [
+    'Python, Django, SQL, Docker',
+    'JavaScript, React, CSS, HTML',
+    'Java, Spring, AWS, Kubernetes',
+]
+
+
+class QueryBudgetTests(TempMediaTestCase):
+    """The main pages stay within their query budgets as data grows"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.hr, cls.candidate = seed(0)
+        # Counters are created on first use; create them up front so the
+        # first round measures steady-state pages
+        UserStats.for_user(cls.hr)
+        UserStats.for_user(cls.candidate)
+
+    def setUp(self):
+        self.clients = {'hr': self.client_class(), 'candidate': self.client_class()}
+        self.clients['hr'].force_login(self.hr)
+        self.clients['candidate'].force_login(self.candidate)
+
+    def count_queries(self):
+        job = Job.objects.filter(hr=self.hr).first()
+        hr_analysis = SkillAnalysis.objects.filter(job=job).first()
+        candidate_analysis = SkillAnalysis.objects.filter(resume__user=self.candidate).first()
+        arguments = {
+            'job_detail': [job.id],
+            'candidate_detail': [hr_analysis.id],
+            'analysis_result': [candidate_analysis.id],
+        }
+
+        counts = {}
+        for role, name, _ in QUERY_BUDGETS:
+            with CaptureQueriesContext(connection) as queries:
+                response = self.clients[role].get(reverse(name, args=arguments.get(name, [])))
+            self.assertEqual(response.status_code, 200, name)
+            counts[name] = len(queries)
+        return counts
+
+    def test_pages_within_budget_as_data_grows(self):
+        first = self.count_queries()
+        seed(1, hr=self.hr, candidate=self.candidate)
+        second = self.count_queries()
+
+        for _, name, budget in QUERY_BUDGETS:
+            with self.subTest(page=name):
+                self.assertLessEqual(second[name], budget)
+                self.assertLessEqual(second[name], first[name], 'query count grows with the data')
+
+
+def seed(round_number, hr=None, candidate=None):
+    """Add a job, candidates, resumes, analyses and notifications"""
+    if hr is None:
+        hr = User.objects.create_user('querycheck_hr', first_name='Query', last_name='Check')
+        UserProfile.objects.create(user=hr, role='HR')
+
+    Job.objects.create(
+        hr=hr,
+        title=f'Query Check Job {round_number}',
+        description='Query budget check',
+        required_skills=SKILL_SETS[round_number % len(SKILL_SETS)],
+    )
+
+    users = [] if candidate is None else [candidate]
+    for i in range(3):
+        user = User.objects.create_user(
+            f'querycheck_{round_number}_{i}', first_name='Candidate', last_name=str(i),
+            email=f'querycheck_{round_number}_{i}@example.com',
+        )
+        UserProfile.objects.create(user=user, role='USER')
+        users.append(user)
+
+    for user in users:
+        resume = Resume(
+            user=user,
+            extracted_text=f'Experienced with {SKILL_SETS[user.id % len(SKILL_SETS)]}',
+            extraction_status=Resume.EXTRACTION_OK,
+        )
+        resume.resume_file.save('resume.pdf', ContentFile(b'%PDF-1.4'), save=False)
+        resume.save()
+
+        for analysed_job in Job.objects.filter(hr=hr):
+            analysis = SkillAnalysis(resume=resume, job=analysed_job)
+            analysis.apply_match_result(
+                calculate_skill_match(resume.get_skills(), analysed_job.get_required_skills())
+            )
+        Notification.objects.bulk_create([
+            Notification(user=user, message=f'Update {n}') for n in range(3)
+        ])
+        UserStats.recount([user.id], ['unread_notification_count'])
+
+    return hr, users[0]
@@ -0,0 +1,75 @@
+from django.contrib.auth.models import User
+from django.core.files.base import ContentFile
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from analyzer.models import Job, Notification, Resume, SkillAnalysis, UserProfile, UserStats
+from analyzer.tests.base import TempMediaTestCase
+from analyzer.utils import calculate_skill_match
+
+# Most queries deleting a job may run, however many candidates applied
+DELETE_JOB_BUDGET = 20
+
+
+class CascadeDeleteStatsTests(TempMediaTestCase):
+    """Cascading deletes recount the affected users once instead of per row"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.hr = User.objects.create_user('stats_hr')
+        UserProfile.objects.create(user=cls.hr, role='HR')
+        UserStats.for_user(cls.hr)
+        cls.jobs = [
+            Job.objects.create(hr=cls.hr, title=f'Job {n}', description='d', required_skills='Python, SQL')
+            for n in range(2)
+        ]
+
+        cls.candidates = []
+        for n in range(30):
+            user = User.objects.create_user(f'stats_candidate_{n}')
+            UserProfile.objects.create(user=user, role='USER')
+            UserStats.for_user(user)
+            cls.candidates.append(user)
+
+            resume = Resume(user=user, extracted_text='Python', extraction_status=Resume.EXTRACTION_OK)
+            resume.resume_file.save('resume.pdf', ContentFile(b'%PDF-1.4'), save=False)
+            resume.save()
+            for job in cls.jobs:
+                SkillAnalysis(resume=resume, job=job).apply_match_result(
+                    calculate_skill_match(['Python'], job.get_required_skills())
+                )
+            Notification.objects.create(user=user, message='Welcome')
+
+    def assertCountersMatchRecount(self):
+        fields = list(UserStats.counters())
+        stored = {stats['user']: stats for stats in UserStats.objects.values('user', *fields)}
+        UserStats.recount(list(stored))
+        recounted = {stats['user']: stats for stats in UserStats.objects.values('user', *fields)}
+        self.assertEqual(stored, recounted)
+
+    def test_delete_job_query_count_is_bounded(self):
+        self.client.force_login(self.hr)
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(reverse('delete_job', args=[self.jobs[0].id]))
+        self.assertEqual(response.status_code, 302)
+        self.assertFalse(Job.objects.filter(id=self.jobs[0].id).exists())
+        self.assertLessEqual(len(queries), DELETE_JOB_BUDGET)
+        self.assertCountersMatchRecount()
+
+    def test_delete_resume_updates_counters(self):
+        resume = Resume.objects.filter(user=self.candidates[0]).get()
+        resume.delete()
+        self.assertCountersMatchRecount()
+
+    def test_delete_users_updates_counters(self):
+        self.candidates[1].delete()
+        User.objects.filter(id__in=[self.candidates[2].id, self.candidates[3].id]).delete()
+        self.assertCountersMatchRecount()
+        self.hr.delete()
+        self.assertCountersMatchRecount()
+
+    def test_delete_single_rows_updates_counters(self):
+        SkillAnalysis.objects.filter(resume__user=self.candidates[4]).first().delete()
+        Notification.objects.filter(user=self.candidates[5]).delete()
+        self.assertCountersMatchRecount()
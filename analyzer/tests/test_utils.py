@@ -0,0 +1,45 @@
+import random
+
+from django.test import SimpleTestCase
+
+from analyzer.utils import SKILL_MATCHER, extract_skills_from_pages, extract_skills_from_text
+
+
+def split_at(text, cuts):
+    cuts = sorted(cuts)
+    return [text[start:end] for start, end in zip([0] + cuts, cuts + [len(text)])]
+
+
+class ExtractSkillsFromPagesTests(SimpleTestCase):
+    # Separators and characters that sit next to skills in real resume text
+    FILLERS = [' ', '\n', '\n\n', '\t', '  ', ',', '.', '(', ')', '-', '/', '+', '#', 's', 'x']
+
+    def assertSameAsWholeText(self, pages):
+        text = ''.join(pages)
+        self.assertEqual(extract_skills_from_pages(pages), extract_skills_from_text(text), repr(pages))
+
+    def test_random_split_points(self):
+        rng = random.Random(13)
+        skills = SKILL_MATCHER.skills
+        for _ in range(500):
+            parts = []
+            for _ in range(rng.randint(0, 60)):
+                part = rng.choice(skills) if rng.random() < 0.5 else rng.choice(self.FILLERS)
+                parts.append(part.upper() if rng.random() < 0.3 else part)
+            text = ''.join(parts)
+            cuts = rng.sample(range(len(text) + 1), min(len(text) + 1, rng.randint(0, 8)))
+            self.assertSameAsWholeText(split_at(text, cuts))
+
+    def test_longest_skill_split_at_every_position(self):
+        longest = max(SKILL_MATCHER.skills, key=len)
+        # Padding longer than the overlap pushes the skill's start out of the
+        # previous piece's tail unless the overlap is sized for it
+        text = 'x ' * SKILL_MATCHER.max_length + longest + 's and more text'
+        start = text.index(longest)
+        for cut in range(start, start + len(longest) + 2):
+            self.assertSameAsWholeText(split_at(text, [cut]))
+            self.assertSameAsWholeText(split_at(text, [start - 1, cut]))
+
+    def test_every_character_on_its_own_page(self):
+        text = 'Skills: Machine Learning, REST APIs, Node.js and C++ with PostgreSQL'
+        self.assertSameAsWholeText(list(text))
@@ -1,6 +1,6 @@
 from django.urls import path
 from django.contrib.auth import views as auth_views
-from . import views
+from . import streams, views
 
 urlpatterns = [
     # Authentication URLs
@@ -16,10 +16,14 @@ urlpatterns = [
     path('upload-resume/', views.upload_resume, name='upload_resume'),
     path('analyze-resume/<int:resume_id>/<int:job_id>/', views.analyze_resume, name='analyze_resume'),
     path('analysis-result/<int:analysis_id>/', views.analysis_result, name='analysis_result'),
+    path('analysis-task/<int:task_id>/', views.analysis_task_status, name='analysis_task_status'),
     path('resume-history/', views.resume_history, name='resume_history'),
     path('delete-resume/<int:resume_id>/', views.delete_resume, name='delete_resume'),
     path('notifications/', views.notifications, name='notifications'),
+    path('notifications/unread-count/', views.unread_notification_count, name='unread_notification_count'),
+    path('notifications/stream/', streams.notification_stream, name='notification_stream'),
     path('mark-notification-read/<int:notification_id>/', views.mark_notification_read, name='mark_notification_read'),
+    path('mark-notifications-read/', views.mark_notifications_read, name='mark_notifications_read'),
     
     # HR URLs
     path('hr-dashboard/', views.hr_dashboard, name='hr_dashboard'),
@@ -28,13 +32,16 @@ urlpatterns = [
     path('job-detail/<int:job_id>/', views.job_detail, name='job_detail'),
     path('delete-job/<int:job_id>/', views.delete_job, name='delete_job'),
     path('bulk-upload/', views.bulk_upload, name='bulk_upload'),
+    path('bulk-upload/<uuid:batch>/', views.bulk_upload_status, name='bulk_upload_status'),
     path('filter-resumes/', views.filter_resumes, name='filter_resumes'),
     path('candidate-detail/<int:analysis_id>/', views.candidate_detail, name='candidate_detail'),
     path('accept-candidate/<int:analysis_id>/', views.accept_candidate, name='accept_candidate'),
     path('reject-candidate/<int:analysis_id>/', views.reject_candidate, name='reject_candidate'),
     path('send-feedback/<int:analysis_id>/', views.send_feedback, name='send_feedback'),
+    path('batch-decision/', views.batch_decision, name='batch_decision'),
     path('analytics/', views.analytics, name='analytics'),
     path('export-analysis/<int:analysis_id>/<str:format>/', views.export_analysis, name='export_analysis'),
+    path('export-analyses/<str:format>/', views.export_analyses, name='export_analyses'),
     
     # AJAX URLs
     path('get-jobs/', views.get_jobs, name='get_jobs'),
@@ -1,58 +1,121 @@
 import PyPDF2
 from docx import Document
+import hashlib
+import json
 import re
 import string
 from collections import Counter
+from contextlib import contextmanager
+from itertools import islice
+from types import MappingProxyType
+from django.conf import settings
 from django.core.files.storage import default_storage
 
 
-def extract_text_from_pdf(file_path):
-    """Extract text from PDF file"""
+class ExtractionError(Exception):
+    """A resume file could not be turned into text"""
+    INVALID = 'INVALID'
+    UNSUPPORTED = 'UNSUPPORTED'
+    TIMEOUT = 'TIMEOUT'
+    MEMORY = 'MEMORY'
+    CRASHED = 'CRASHED'
+
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+@contextmanager
+def parser_errors(label):
+    """Report parser failures as ExtractionError, letting MemoryError through"""
     try:
-        with open(file_path, 'rb') as file:
-            pdf_reader = PyPDF2.PdfReader(file)
-            text = ""
-            for page in pdf_reader.pages:
-                text += page.extract_text() + "\n"
-        return text
+        yield
+    except (ExtractionError, MemoryError):
+        raise
     except Exception as e:
-        return f"Error extracting PDF: {str(e)}"
+        raise ExtractionError(ExtractionError.INVALID, f"Error extracting {label}: {str(e)}") from e
+
+
+def iter_pdf_pages(file_path, max_pages=None, max_chars=None):
+    """Yield the text of a PDF one page at a time, stopping at the page or character limit"""
+    remaining = max_chars
+    with open(file_path, 'rb') as file:
+        pdf_reader = PyPDF2.PdfReader(file)
+        for page in islice(pdf_reader.pages, max_pages):
+            text = page.extract_text() + "\n"
+            if remaining is not None:
+                text = text[:remaining]
+                remaining -= len(text)
+            yield text
+            if remaining == 0:
+                break
+
+
+def extract_text_from_pdf(file_path, max_pages=None, max_chars=None):
+    """Extract text from PDF file"""
+    with parser_errors('PDF'):
+        return "".join(iter_pdf_pages(file_path, max_pages, max_chars))
 
 
 def extract_text_from_docx(file_path):
     """Extract text from DOCX file"""
-    try:
+    with parser_errors('DOCX'):
         doc = Document(file_path)
-        text = ""
-        for paragraph in doc.paragraphs:
-            text += paragraph.text + "\n"
-        return text
-    except Exception as e:
-        return f"Error extracting DOCX: {str(e)}"
+        return "".join(paragraph.text + "\n" for paragraph in doc.paragraphs)
 
 
-def extract_text_from_resume(resume_file):
-    """Extract text from resume file based on extension"""
-    file_path = resume_file.path
-    file_extension = resume_file.name.lower().split('.')[-1]
+def hash_file(file):
+    """SHA-256 of an uploaded or stored file's bytes, read in chunks"""
+    digest = hashlib.sha256()
+    for chunk in file.chunks():
+        digest.update(chunk)
+    file.seek(0)
+    return digest.hexdigest()
+
+
+def extract_text_from_file(file_path, file_name):
+    """Extract text from a resume on disk, picking the parser from the file name"""
+    file_extension = file_name.lower().split('.')[-1]
     
     if file_extension == 'pdf':
-        return extract_text_from_pdf(file_path)
+        return extract_text_from_pdf(file_path, settings.RESUME_MAX_PAGES, settings.RESUME_MAX_CHARS)
     elif file_extension == 'docx':
         return extract_text_from_docx(file_path)
     else:
-        return "Unsupported file format"
+        raise ExtractionError(ExtractionError.UNSUPPORTED, "Unsupported file format")
 
 
-def clean_text(text):
-    """Clean and normalize text"""
+def scan_resume_file(file_path, file_name):
+    """Extract a resume's text and skills, scanning PDFs page by page as they are read"""
+    if file_name.lower().split('.')[-1] != 'pdf':
+        text = extract_text_from_file(file_path, file_name)
+        return text, extract_skills_from_text(text)
+
+    pages = []
+
+    def read_pages():
+        for page in iter_pdf_pages(file_path, settings.RESUME_MAX_PAGES, settings.RESUME_MAX_CHARS):
+            pages.append(page)
+            yield page
+
+    with parser_errors('PDF'):
+        skills = extract_skills_from_pages(read_pages())
+    return "".join(pages), skills
+
+
+def normalize_text(text):
+    """Lowercase text and blank out whitespace runs and punctuation, without stripping"""
     # Convert to lowercase
     text = text.lower()
     # Remove extra whitespace and newlines
     text = re.sub(r'\s+', ' ', text)
     # Remove punctuation except for specific cases
-    text = re.sub(r'[^\w\s\+\#\.]', ' ', text)
-    return text.strip()
+    return re.sub(r'[^\w\s\+\#\.]', ' ', text)
+
+
+def clean_text(text):
+    """Clean and normalize text"""
+    return normalize_text(text).strip()
 
 
 def get_predefined_skills():
@@ -150,43 +213,145 @@ def get_predefined_skills():
     }
 
 
+class SkillMatcher:
+    """Single-pass matcher for a fixed skill vocabulary.
+
+    Skills are stored in a character trie. Matching walks the trie once from
+    every word boundary in the cleaned text, applying the same ``\\b<skill>s?\\b``
+    rule the per-skill regexes used, so all skills are found in one scan.
+    """
+
+    def __init__(self, skills):
+        self.trie = {}
+        # Longest first so multi-word skills win over their shorter parts
+        self.skills = sorted(dict.fromkeys(skills), key=len, reverse=True)
+        self.max_length = 0
+
+        for skill in self.skills:
+            # Escape dots exactly as the old per-skill patterns did, so
+            # every skill keeps matching the same text it always has
+            pattern = skill.lower().replace('.', r'\.')
+            self.max_length = max(self.max_length, len(pattern))
+            node = self.trie
+            for char in pattern:
+                node = node.setdefault(char, {})
+            node.setdefault(None, []).append(skill)
+
+    def find_all(self, cleaned_text):
+        """Return the set of skills present in already-cleaned text"""
+        starts = [m.start() for m in re.finditer(r'\b', cleaned_text)]
+        boundaries = set(starts)
+        text_length = len(cleaned_text)
+        found = set()
+
+        for start in starts:
+            node = self.trie
+            position = start
+            while position < text_length:
+                node = node.get(cleaned_text[position])
+                if node is None:
+                    break
+                position += 1
+                if None in node and (
+                    position in boundaries
+                    or (position < text_length
+                        and cleaned_text[position] == 's'
+                        and position + 1 in boundaries)
+                ):
+                    found.update(node[None])
+
+        return found
+
+
+def build_skill_matcher():
+    """Build a SkillMatcher over every predefined skill"""
+    all_skills = []
+    for skills in get_predefined_skills().values():
+        all_skills.extend(skills)
+    return SkillMatcher(all_skills)
+
+
+SKILL_MATCHER = build_skill_matcher()
+
+
+def get_taxonomy_fingerprint():
+    """Fingerprint the skill taxonomy so cached skill sets can detect changes"""
+    taxonomy = json.dumps([get_predefined_skills(), get_skill_synonyms()])
+    return hashlib.sha256(taxonomy.encode('utf-8')).hexdigest()
+
+
+def get_text_fingerprint(text):
+    """Fingerprint a text on its own, e.g. to tell which text the term index was built from"""
+    return hashlib.sha256((text or '').encode('utf-8')).hexdigest()
+
+
+def get_skills_fingerprint(text):
+    """Fingerprint a text together with the taxonomy its skills were extracted with"""
+    text_hash = get_text_fingerprint(text)
+    return hashlib.sha256(f"{SKILL_TAXONOMY_FINGERPRINT}:{text_hash}".encode('utf-8')).hexdigest()
+
+
 def extract_skills_from_text(text):
     """Extract skills from text using predefined skill categories with enhanced matching"""
     cleaned_text = clean_text(text)
-    predefined_skills = get_predefined_skills()
-    
+    return select_skills(SKILL_MATCHER.find_all(cleaned_text))
+
+
+def extract_skills_from_pages(pages):
+    """Extract skills from text that arrives in pieces, such as PDF pages.
+
+    Gives the same result as extract_skills_from_text on the joined pieces
+    while only holding one page and a short overlap in memory.
+    """
+    present_skills = set()
+    pending = ''
+    tail = ''
+    # Room for the longest skill in the taxonomy, its plural 's' and the
+    # character after it, so any match that ends in a new piece fits
+    overlap = SKILL_MATCHER.max_length + 2
+
+    for page in pages:
+        pending += page
+
+        # Cut just after the last whitespace before a word, so normalizing
+        # the pieces separately never splits a word or a whitespace run
+        cut = len(pending.rstrip())
+        while cut and not pending[cut - 1].isspace():
+            cut -= 1
+        if not cut:
+            continue
+
+        segment = tail + normalize_text(pending[:cut])
+        present_skills |= SKILL_MATCHER.find_all(segment)
+        pending = pending[cut:]
+
+        # Keep enough text for skills that run across pieces, starting after
+        # a space so the first word boundary is the same as in the full text
+        tail = segment[segment.rfind(' ', 0, max(len(segment) - overlap, 0)) + 1:]
+
+    present_skills |= SKILL_MATCHER.find_all(tail + normalize_text(pending))
+    return select_skills(present_skills)
+
+
+def select_skills(present_skills):
+    """Turn the set of matched skills into the de-duplicated, title-cased skill list"""
+    # Walk matches longest first to keep multi-word skills over their parts
     found_skills = []
-    skill_categories = {}
-    
-    # Flatten all skills
-    all_skills = []
-    for category, skills in predefined_skills.items():
-        all_skills.extend(skills)
-        for skill in skills:
-            skill_categories[skill] = category
-    
-    # Sort skills by length (longest first) to match multi-word skills first
-    all_skills.sort(key=len, reverse=True)
-    
-    # Find skills in text
-    for skill in all_skills:
-        # Create regex pattern for skill matching (more flexible)
-        skill_pattern = skill.lower().replace('.', r'\.')
-        pattern = r'\b' + re.escape(skill_pattern) + r's?\b'  # Allow plural forms
+    found_normalized = set()
+    found_groups = set()
+    for skill in SKILL_MATCHER.skills:
+        if skill not in present_skills:
+            continue
         
-        if re.search(pattern, cleaned_text):
-            # Normalize the skill name for consistent output
-            normalized = normalize_skill(skill)
-            
-            # Check if we already have this skill or its synonym
-            already_added = False
-            for existing in found_skills:
-                if skills_match(skill, existing):
-                    already_added = True
-                    break
-            
-            if not already_added:
-                found_skills.append(skill)
+        # Check if we already have this skill or its synonym
+        normalized = normalize_skill(skill)
+        groups = SKILL_SYNONYM_GROUPS.get(normalized, frozenset())
+        if normalized in found_normalized or not groups.isdisjoint(found_groups):
+            continue
+        
+        found_skills.append(skill)
+        found_normalized.add(normalized)
+        found_groups.update(groups)
     
     # Remove duplicates and normalize to title case
     unique_skills = []
@@ -260,17 +425,35 @@ def get_skill_synonyms():
 
 
 
+def build_synonym_index(synonyms):
+    """Map every synonym variant to its canonical form and synonym groups"""
+    canonical_forms = {}
+    synonym_groups = {}
+    
+    for canonical, variations in synonyms.items():
+        for variation in variations:
+            variation = variation.lower()
+            # The first group listing a variant decides its canonical form
+            canonical_forms.setdefault(variation, canonical)
+            synonym_groups.setdefault(variation, set()).add(canonical)
+    
+    return (
+        MappingProxyType(canonical_forms),
+        MappingProxyType({
+            variation: frozenset(groups) for variation, groups in synonym_groups.items()
+        }),
+    )
+
+
+SKILL_CANONICAL_FORMS, SKILL_SYNONYM_GROUPS = build_synonym_index(get_skill_synonyms())
+
+SKILL_TAXONOMY_FINGERPRINT = get_taxonomy_fingerprint()
+
+
 def normalize_skill(skill):
     """Normalize skill name to its canonical form"""
     skill_lower = skill.lower().strip()
-    synonyms = get_skill_synonyms()
-    
-    # Check if skill matches any synonym group
-    for canonical, variations in synonyms.items():
-        if skill_lower in [v.lower() for v in variations]:
-            return canonical
-    
-    return skill_lower
+    return SKILL_CANONICAL_FORMS.get(skill_lower, skill_lower)
 
 
 def skills_match(skill1, skill2):
@@ -283,44 +466,49 @@ def skills_match(skill1, skill2):
         return True
     
     # Check if they belong to the same synonym group
-    synonyms = get_skill_synonyms()
-    for canonical, variations in synonyms.items():
-        variations_lower = [v.lower() for v in variations]
-        if norm1 in variations_lower and norm2 in variations_lower:
-            return True
-    
-    return False
+    groups1 = SKILL_SYNONYM_GROUPS.get(norm1)
+    groups2 = SKILL_SYNONYM_GROUPS.get(norm2)
+    return bool(groups1 and groups2 and not groups1.isdisjoint(groups2))
 
 
-def calculate_skill_match(resume_skills, job_skills):
-    """Calculate skill match between resume and job requirements with intelligent matching"""
-    resume_skills_lower = [skill.lower().strip() for skill in resume_skills]
-    job_skills_lower = [skill.lower().strip() for skill in job_skills]
+def build_resume_skill_keys(resume_skills):
+    """Canonicalize resume skills into sets of canonical forms and synonym groups"""
+    canonical_forms = set()
+    groups = set()
+    for skill in resume_skills:
+        normalized = normalize_skill(skill)
+        canonical_forms.add(normalized)
+        groups.update(SKILL_SYNONYM_GROUPS.get(normalized, ()))
+    return canonical_forms, groups
+
+
+def build_job_skill_keys(job_skills):
+    """Canonicalize job skills, keeping each one's canonical form and synonym groups"""
+    keys = []
+    for skill in job_skills:
+        normalized = normalize_skill(skill)
+        keys.append((skill, normalized, SKILL_SYNONYM_GROUPS.get(normalized, frozenset())))
+    return keys
+
+
+def match_skill_keys(resume_keys, job_keys):
+    """Score canonicalized job skills against canonicalized resume skills"""
+    resume_forms, resume_groups = resume_keys
     
     matched_skills = []
     missing_skills = []
-    matched_job_indices = set()
-    
-    # First pass: exact matching with synonym support
-    for i, job_skill in enumerate(job_skills):
-        job_skill_lower = job_skill.lower().strip()
-        matched = False
-        
-        for resume_skill in resume_skills:
-            resume_skill_lower = resume_skill.lower().strip()
-            
-            # Check if skills match (including synonyms)
-            if skills_match(job_skill_lower, resume_skill_lower):
-                if job_skill not in matched_skills:
-                    matched_skills.append(job_skill)
-                    matched_job_indices.add(i)
-                    matched = True
-                    break
-        
-        if not matched:
+    matched_lookup = set()
+    
+    for job_skill, normalized, groups in job_keys:
+        # A job skill matches when the resume has its canonical form or a synonym
+        if ((normalized in resume_forms or not groups.isdisjoint(resume_groups))
+                and job_skill not in matched_lookup):
+            matched_skills.append(job_skill)
+            matched_lookup.add(job_skill)
+        else:
             missing_skills.append(job_skill)
     
-    total_job_skills = len(job_skills)
+    total_job_skills = len(job_keys)
     matched_count = len(matched_skills)
     
     if total_job_skills == 0:
@@ -338,6 +526,63 @@ def calculate_skill_match(resume_skills, job_skills):
     }
 
 
+def calculate_skill_match(resume_skills, job_skills):
+    """Calculate skill match between resume and job requirements with intelligent matching"""
+    return match_skill_keys(build_resume_skill_keys(resume_skills), build_job_skill_keys(job_skills))
+
+
+def calculate_skill_match_for_jobs(resume_skills, job_skill_lists):
+    """Score one resume's skills against many jobs, canonicalizing the resume once"""
+    resume_keys = build_resume_skill_keys(resume_skills)
+    return [
+        match_skill_keys(resume_keys, build_job_skill_keys(job_skills))
+        for job_skills in job_skill_lists
+    ]
+
+
+def calculate_skill_match_for_resumes(resume_skill_lists, job_skills):
+    """Score many resumes' skills against one job, canonicalizing the job once"""
+    job_keys = build_job_skill_keys(job_skills)
+    return [
+        match_skill_keys(build_resume_skill_keys(resume_skills), job_keys)
+        for resume_skills in resume_skill_lists
+    ]
+
+
+def diff_taxonomies(old_skills, old_synonyms, new_skills, new_synonyms):
+    """Get the lowercase terms whose extraction or matching differs between two taxonomies"""
+    def flatten(skills):
+        return {skill.lower() for category in skills.values() for skill in category}
+    
+    changed_terms = flatten(old_skills) ^ flatten(new_skills)
+    
+    old_forms, old_groups = build_synonym_index(old_synonyms)
+    new_forms, new_groups = build_synonym_index(new_synonyms)
+    variants = old_forms.keys() | new_forms.keys()
+    for variant in variants:
+        if (old_forms.get(variant) != new_forms.get(variant)
+                or old_groups.get(variant) != new_groups.get(variant)):
+            changed_terms.add(variant)
+    
+    # Groups are looked up through the canonical form, so a change to a
+    # canonical form's groups affects every variant that maps onto it
+    for variant in variants:
+        if old_forms.get(variant) in changed_terms or new_forms.get(variant) in changed_terms:
+            changed_terms.add(variant)
+    
+    return changed_terms
+
+
+def get_text_terms(text, max_length=64):
+    """Get the distinct word tokens of cleaned text, as stored in the resume term index"""
+    return {term[:max_length] for term in re.findall(r'\w+', clean_text(text or ''))}
+
+
+def get_skill_term_pieces(skill, max_length=64):
+    """Split a skill into the word tokens a text containing it must also contain"""
+    return [piece[:max_length] for piece in re.findall(r'\w+', skill.lower())]
+
+
 def determine_readiness_level(match_score):
     """Determine readiness level based on match score"""
     if match_score >= 90:
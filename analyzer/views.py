@@ -2,31 +2,36 @@ from django.shortcuts import render, redirect, get_object_or_404
 from django.contrib.auth import login, authenticate
 from django.contrib.auth.decorators import login_required
 from django.contrib import messages
-from django.http import JsonResponse, HttpResponse
-from django.core.paginator import Paginator
-from django.db.models import Q, Count, Avg
+from django.http import JsonResponse, HttpResponse, FileResponse, StreamingHttpResponse
+from django.db import transaction
+from django.db.models import Q, Count, Avg, OuterRef, Subquery
 from django.views.decorators.csrf import csrf_exempt
 from django.views.decorators.http import require_http_methods
 from django.core.files.storage import default_storage
 from django.conf import settings
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils import timezone
+from django.utils.http import http_date
 from django.contrib.auth.models import User
 import json
 import os
 import re
-from reportlab.pdfgen import canvas
-from reportlab.lib.pagesizes import letter
-from reportlab.lib import colors
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.lib.units import inch
-
-from .models import UserProfile, Resume, Job, SkillAnalysis, Notification
-from .forms import CustomUserCreationForm, ResumeUploadForm, JobCreationForm, BulkResumeUploadForm, FilterForm
-from .utils import (
-    extract_text_from_resume, extract_skills_from_text, calculate_skill_match,
-    determine_readiness_level, parse_skills_from_string, format_skills_list,
-    get_skill_suggestions
+import uuid
+
+from .models import (
+    UserProfile, Resume, ResumeQuerySet, Job, SkillAnalysis, AnalysisSkill, AnalysisTask, Notification,
+    UserStats
+)
+from .forms import (
+    CustomUserCreationForm, ResumeUploadForm, JobCreationForm, BulkResumeUploadForm, FilterForm, BatchDecisionForm
 )
+from .decisions import acceptance_message, rejection_message, feedback_message, notify_candidates
+from .pagination import paginate
+from .reports import (
+    get_report, report_version, stream_csv, stream_jsonl, stream_report_zip, EXPORT_CHUNK_SIZE
+)
+from .tasks import enqueue_analysis
+from .utils import extract_skills_from_text, calculate_skill_match, get_skill_suggestions
 
 
 def home(request):
@@ -100,18 +105,19 @@ def dashboard(request):
     
     # Get user's resumes and analyses
     resumes = Resume.objects.filter(user=request.user).order_by('-uploaded_at')[:5]
-    analyses = SkillAnalysis.objects.filter(resume__user=request.user).order_by('-analyzed_at')[:5]
+    analyses = SkillAnalysis.objects.filter(resume__user=request.user).for_listing().order_by('-analyzed_at')[:5]
     notifications = Notification.objects.filter(user=request.user, is_read=False).order_by('-created_at')[:5]
-    jobs = Job.objects.all().order_by('-created_at')[:10]
+    jobs = Job.objects.select_related('hr').order_by('-created_at')[:10]
+    stats = UserStats.for_user(request.user)
     
     context = {
         'resumes': resumes,
         'analyses': analyses,
         'notifications': notifications,
         'jobs': jobs,
-        'total_resumes': Resume.objects.filter(user=request.user).count(),
-        'total_analyses': SkillAnalysis.objects.filter(resume__user=request.user).count(),
-        'unread_notifications': Notification.objects.filter(user=request.user, is_read=False).count(),
+        'total_resumes': stats.resume_count,
+        'total_analyses': stats.analysis_count,
+        'unread_notifications': stats.unread_notification_count,
     }
     
     return render(request, 'user/dashboard.html', context)
@@ -128,16 +134,22 @@ def hr_dashboard(request):
         messages.error(request, 'Access denied.')
         return redirect('dashboard')
     
-    # Get HR statistics
+    # HR statistics come from the user's stored counters
     jobs = Job.objects.filter(hr=request.user)
-    analyses = SkillAnalysis.objects.filter(job__hr=request.user)
+    stats = UserStats.for_user(request.user)
+    # Picking the ids without joins lets the database walk the analyzed_at
+    # index newest first and stop after ten rows, instead of sorting every
+    # analysis of the HR user's jobs
+    recent_ids = list(
+        SkillAnalysis.objects.filter(job__in=jobs.values('id')).values_list('id', flat=True)[:10]
+    )
     
     context = {
-        'total_jobs': jobs.count(),
-        'total_analyses': analyses.count(),
-        'avg_match_score': analyses.aggregate(Avg('match_score'))['match_score__avg'] or 0,
+        'total_jobs': stats.job_count,
+        'total_analyses': stats.job_analysis_count,
+        'avg_match_score': stats.average_match_score,
         'recent_jobs': jobs[:5],
-        'recent_analyses': analyses[:10],
+        'recent_analyses': SkillAnalysis.objects.filter(id__in=recent_ids).for_listing(),
     }
     
     return render(request, 'hr/dashboard.html', context)
@@ -158,18 +170,23 @@ def upload_resume(request):
     if request.method == 'POST':
         form = ResumeUploadForm(request.POST, request.FILES)
         if form.is_valid():
-            resume = form.save(commit=False)
-            resume.user = request.user
-            resume.save()
+            resume = Resume.create_from_upload(request.user, form.cleaned_data['resume_file'])
             
-            # Extract text from resume
-            try:
-                extracted_text = extract_text_from_resume(resume.resume_file)
-                resume.extracted_text = extracted_text
-                resume.save()
+            # Extract text from resume in the background, unless the same file was seen before
+            if resume.extraction_failed:
+                messages.warning(request, f'Resume uploaded but text extraction failed: {resume.extraction_error}')
+                return redirect('candidate_view' if is_hr_user else 'resume_history')
+            if resume.extraction_status == Resume.EXTRACTION_OK:
+                messages.success(request, 'Resume uploaded and processed successfully!')
+                return redirect('candidate_view' if is_hr_user else 'resume_history')
+            
+            task = enqueue_analysis(resume, request.user)
+            if task.status == AnalysisTask.DONE:
                 messages.success(request, 'Resume uploaded and processed successfully!')
-            except Exception as e:
-                messages.warning(request, f'Resume uploaded but text extraction failed: {str(e)}')
+            elif task.status == AnalysisTask.FAILED:
+                messages.warning(request, f'Resume uploaded but text extraction failed: {task.error}')
+            else:
+                messages.success(request, 'Resume uploaded! It is being processed in the background.')
             
             # Redirect based on user type
             if is_hr_user:
@@ -194,57 +211,44 @@ def analyze_resume(request, resume_id, job_id):
     job = get_object_or_404(Job, id=job_id)
     
     # Check if analysis already exists
-    analysis, created = SkillAnalysis.objects.get_or_create(
-        resume=resume,
-        job=job,
-        defaults={
-            'matched_skills': '',
-            'missing_skills': '',
-            'gap_percentage': 0,
-            'match_score': 0,
-            'readiness_level': 'BEGINNER'
-        }
-    )
+    analysis = SkillAnalysis.objects.filter(resume=resume, job=job).first()
+    if analysis and analysis.matched_skills:
+        return redirect('analysis_result', analysis_id=analysis.id)
+    
+    # Reuse a task that is already queued for this pair
+    task = AnalysisTask.objects.filter(
+        resume=resume, job=job, status__in=[AnalysisTask.PENDING, AnalysisTask.RUNNING]
+    ).first()
+    if not task:
+        task = enqueue_analysis(resume, request.user, job=job)
+    
+    return redirect('analysis_task_status', task_id=task.id)
+
+
+@login_required
+def analysis_task_status(request, task_id):
+    """Poll a background analysis task, redirecting once it has finished"""
+    task = get_object_or_404(AnalysisTask, id=task_id, requested_by=request.user)
     
-    if created or not analysis.matched_skills:
-        try:
-            # Extract skills from resume
-            if resume.extracted_text:
-                resume_skills = extract_skills_from_text(resume.extracted_text)
-            else:
-                # If no extracted text, try to extract it now
-                extracted_text = extract_text_from_resume(resume.resume_file)
-                resume.extracted_text = extracted_text
-                resume.save()
-                resume_skills = extract_skills_from_text(extracted_text)
-            
-            # Parse job skills
-            job_skills = parse_skills_from_string(job.required_skills)
-            
-            # Calculate match
-            match_result = calculate_skill_match(resume_skills, job_skills)
-            
-            # Update analysis
-            analysis.matched_skills = format_skills_list(match_result['matched_skills'])
-            analysis.missing_skills = format_skills_list(match_result['missing_skills'])
-            analysis.gap_percentage = match_result['gap_percentage']
-            analysis.match_score = match_result['match_score']
-            analysis.readiness_level = determine_readiness_level(match_result['match_score'])
-            analysis.save()
-            
+    if request.GET.get('format') == 'json':
+        return JsonResponse({
+            'id': task.id,
+            'status': task.status,
+            'analysis_id': task.analysis_id,
+            'error': task.error,
+        })
+    
+    if task.status == AnalysisTask.FAILED:
+        messages.error(request, f'Error during analysis: {task.error}')
+        return redirect('dashboard')
+    
+    if task.status == AnalysisTask.DONE:
+        if task.analysis_id:
             messages.success(request, 'Resume analysis completed successfully!')
-            
-        except Exception as e:
-            messages.error(request, f'Error during analysis: {str(e)}')
-            # Set default values if analysis fails
-            analysis.matched_skills = ''
-            analysis.missing_skills = job.required_skills
-            analysis.gap_percentage = 100
-            analysis.match_score = 0
-            analysis.readiness_level = 'BEGINNER'
-            analysis.save()
+            return redirect('analysis_result', analysis_id=task.analysis_id)
+        return redirect('resume_history')
     
-    return redirect('analysis_result', analysis_id=analysis.id)
+    return render(request, 'user/analysis_pending.html', {'task': task})
 
 
 @login_required
@@ -264,8 +268,7 @@ def analysis_result(request, analysis_id):
             return redirect('dashboard')
     
     # Get skill suggestions
-    missing_skills = parse_skills_from_string(analysis.missing_skills)
-    matched_skills = parse_skills_from_string(analysis.matched_skills)
+    matched_skills, missing_skills = analysis.get_skill_lists()
     suggestions = get_skill_suggestions(missing_skills, matched_skills)
     
     context = {
@@ -283,9 +286,7 @@ def resume_history(request):
     """Resume history"""
     resumes = Resume.objects.filter(user=request.user)
     jobs = Job.objects.all()  # Get all available jobs for analysis
-    paginator = Paginator(resumes, 10)
-    page_number = request.GET.get('page')
-    page_obj = paginator.get_page(page_number)
+    page_obj = paginate(request, resumes, 10, ('-uploaded_at', '-id'))
     
     return render(request, 'user/resume_history.html', {
         'page_obj': page_obj,
@@ -298,9 +299,8 @@ def delete_resume(request, resume_id):
     """Delete a resume"""
     resume = get_object_or_404(Resume, id=resume_id, user=request.user)
     
-    # Delete the resume file from storage
-    if resume.resume_file:
-        resume.resume_file.delete()
+    # Delete the resume file from storage unless an identical upload shares it
+    resume.delete_file()
     
     # Delete the resume record (this will cascade delete related analyses)
     resume.delete()
@@ -313,19 +313,56 @@ def delete_resume(request, resume_id):
 def notifications(request):
     """User notifications"""
     notifications = Notification.objects.filter(user=request.user)
-    paginator = Paginator(notifications, 20)
-    page_number = request.GET.get('page')
-    page_obj = paginator.get_page(page_number)
+    page_obj = paginate(request, notifications, 20, ('-created_at', '-id'), count_limit=1000)
+    
+    if request.GET.get('format') == 'json':
+        return JsonResponse(page_obj.as_dict([{
+            'id': notification.id,
+            'message': notification.message,
+            'is_read': notification.is_read,
+            'created_at': notification.created_at.isoformat(),
+        } for notification in page_obj]))
     
     return render(request, 'user/notifications.html', {'page_obj': page_obj})
 
 
+@login_required
+def unread_notification_count(request):
+    """Unread notification count for polling, read from the user's stored counters"""
+    stats = UserStats.for_user(request.user)
+    response = JsonResponse({'unread': stats.unread_notification_count})
+    response['Cache-Control'] = 'no-cache'
+    return response
+
+
 @login_required
 def mark_notification_read(request, notification_id):
     """Mark notification as read"""
     notification = get_object_or_404(Notification, id=notification_id, user=request.user)
-    notification.is_read = True
-    notification.save()
+    if not notification.is_read:
+        notification.is_read = True
+        notification.save(update_fields=['is_read'])
+    return redirect('notifications')
+
+
+@login_required
+@require_http_methods(["POST"])
+def mark_notifications_read(request):
+    """Mark all or the selected notifications as read in one UPDATE"""
+    unread = Notification.objects.filter(user=request.user, is_read=False)
+    if not request.POST.get('all'):
+        ids = [value for value in request.POST.getlist('ids') if value.isdigit()]
+        unread = unread.filter(id__in=ids)
+    
+    with transaction.atomic():
+        marked = unread.update(is_read=True)
+        # update() skips the signals that keep the unread count in step
+        UserStats.recount([request.user.id], ['unread_notification_count'])
+    
+    if request.GET.get('format') == 'json':
+        return JsonResponse({'marked_read': marked})
+    
+    messages.success(request, f'{marked} notification(s) marked as read.')
     return redirect('notifications')
 
 
@@ -367,10 +404,8 @@ def job_list(request):
         messages.error(request, 'Access denied.')
         return redirect('dashboard')
     
-    jobs = Job.objects.filter(hr=request.user)
-    paginator = Paginator(jobs, 10)
-    page_number = request.GET.get('page')
-    page_obj = paginator.get_page(page_number)
+    jobs = Job.objects.filter(hr=request.user).annotate(candidate_count=Count('skillanalysis'))
+    page_obj = paginate(request, jobs, 10, ('-created_at', '-id'))
     
     return render(request, 'hr/job_list.html', {'page_obj': page_obj})
 
@@ -389,12 +424,12 @@ def job_detail(request, job_id):
         messages.error(request, 'Access denied.')
         return redirect('dashboard')
     
-    analyses = SkillAnalysis.objects.filter(job=job).order_by('-match_score')
+    analyses = list(SkillAnalysis.objects.filter(job=job).for_listing().order_by('-match_score'))
     
     context = {
         'job': job,
         'analyses': analyses,
-        'total_candidates': analyses.count(),
+        'total_candidates': len(analyses),
     }
     
     return render(request, 'hr/job_detail.html', context)
@@ -447,7 +482,7 @@ def bulk_upload(request):
                 files = [files]
             
             uploaded_count = 0
-            analyzed_count = 0
+            batch = uuid.uuid4()
             
             for file in files:
                 try:
@@ -466,40 +501,18 @@ def bulk_upload(request):
                         UserProfile.objects.create(user=temp_user, role='USER')
                     
                     # Create resume
-                    resume = Resume.objects.create(
-                        user=temp_user,
-                        resume_file=file
-                    )
-                    
-                    # Extract text
-                    extracted_text = extract_text_from_resume(resume.resume_file)
-                    resume.extracted_text = extracted_text
-                    resume.save()
+                    resume = Resume.create_from_upload(temp_user, file)
                     
                     uploaded_count += 1
                     
-                    # Analyze resume
-                    resume_skills = extract_skills_from_text(extracted_text)
-                    job_skills = parse_skills_from_string(job.required_skills)
-                    match_result = calculate_skill_match(resume_skills, job_skills)
-                    
-                    SkillAnalysis.objects.create(
-                        resume=resume,
-                        job=job,
-                        matched_skills=format_skills_list(match_result['matched_skills']),
-                        missing_skills=format_skills_list(match_result['missing_skills']),
-                        gap_percentage=match_result['gap_percentage'],
-                        match_score=match_result['match_score'],
-                        readiness_level=determine_readiness_level(match_result['match_score'])
-                    )
-                    
-                    analyzed_count += 1
+                    # Extract and analyze in the background
+                    enqueue_analysis(resume, request.user, job=job, batch=batch)
                     
                 except Exception as e:
                     messages.warning(request, f'Error processing {file.name}: {str(e)}')
             
-            messages.success(request, f'Successfully uploaded {uploaded_count} resumes and analyzed {analyzed_count}.')
-            return redirect('job_detail', job_id=job.id)
+            messages.success(request, f'Successfully uploaded {uploaded_count} resumes and queued them for analysis.')
+            return redirect('bulk_upload_status', batch=batch)
     else:
         form = BulkResumeUploadForm()
     
@@ -507,6 +520,42 @@ def bulk_upload(request):
     return render(request, 'hr/bulk_upload.html', {'form': form, 'jobs': jobs})
 
 
+@login_required
+def bulk_upload_status(request, batch):
+    """Per-file progress of a bulk upload (HR only)"""
+    tasks = (
+        AnalysisTask.objects.filter(batch=batch, requested_by=request.user)
+        .select_related('resume', 'job', 'analysis')
+        .defer(*[f'resume__{name}' for name in ResumeQuerySet.TEXT_FIELDS])
+        .order_by('id')
+    )
+    if not tasks:
+        messages.error(request, 'Upload batch not found.')
+        return redirect('hr_dashboard')
+    
+    files = [{
+        'task_id': task.id,
+        'file_name': task.resume.filename,
+        'status': task.status,
+        'status_display': task.get_status_display(),
+        'error': task.error,
+        'analysis_id': task.analysis_id,
+        'match_score': task.analysis.match_score if task.analysis_id else None,
+    } for task in tasks]
+    finished = sum(task.is_finished for task in tasks)
+    
+    if request.GET.get('format') == 'json':
+        return JsonResponse({'total': len(files), 'finished': finished, 'files': files})
+    
+    return render(request, 'hr/bulk_upload_status.html', {
+        'job': tasks[0].job,
+        'files': files,
+        'total': len(files),
+        'finished': finished,
+        'is_complete': finished == len(files),
+    })
+
+
 @login_required
 def filter_resumes(request):
     """Filter and search resumes (HR only)"""
@@ -520,30 +569,24 @@ def filter_resumes(request):
         return redirect('dashboard')
     
     form = FilterForm(request.GET, user=request.user)
-    analyses = SkillAnalysis.objects.filter(job__hr=request.user)
+    analyses = form.filter_queryset(SkillAnalysis.objects.filter(job__hr=request.user).for_listing())
     
-    if form.is_valid():
-        if form.cleaned_data['min_match_score']:
-            analyses = analyses.filter(match_score__gte=form.cleaned_data['min_match_score'])
-        
-        if form.cleaned_data['max_gap_percentage']:
-            analyses = analyses.filter(gap_percentage__lte=form.cleaned_data['max_gap_percentage'])
-        
-        if form.cleaned_data['readiness_level']:
-            analyses = analyses.filter(readiness_level=form.cleaned_data['readiness_level'])
-        
-        if form.cleaned_data['job']:
-            analyses = analyses.filter(job=form.cleaned_data['job'])
+    page_obj = paginate(request, analyses, 20, ('-match_score', 'id'), count_limit=1000)
     
-    analyses = analyses.order_by('-match_score')
-    paginator = Paginator(analyses, 20)
-    page_number = request.GET.get('page')
-    page_obj = paginator.get_page(page_number)
+    if request.GET.get('format') == 'json':
+        return JsonResponse(page_obj.as_dict([{
+            'id': analysis.id,
+            'resume_id': analysis.resume_id,
+            'job_id': analysis.job_id,
+            'match_score': analysis.match_score,
+            'gap_percentage': analysis.gap_percentage,
+            'readiness_level': analysis.readiness_level,
+            'analyzed_at': analysis.analyzed_at.isoformat(),
+        } for analysis in page_obj]))
     
     return render(request, 'hr/filter_resumes.html', {
         'form': form,
         'page_obj': page_obj,
-        'total_results': analyses.count()
     })
 
 
@@ -561,8 +604,7 @@ def candidate_detail(request, analysis_id):
         messages.error(request, 'Access denied.')
         return redirect('dashboard')
     
-    matched_skills = parse_skills_from_string(analysis.matched_skills)
-    missing_skills = parse_skills_from_string(analysis.missing_skills)
+    matched_skills, missing_skills = analysis.get_skill_lists()
     suggestions = get_skill_suggestions(missing_skills, matched_skills)
     
     context = {
@@ -578,7 +620,7 @@ def candidate_detail(request, analysis_id):
 @login_required
 def accept_candidate(request, analysis_id):
     """Accept candidate (HR only)"""
-    analysis = get_object_or_404(SkillAnalysis, id=analysis_id)
+    analysis = get_object_or_404(SkillAnalysis.objects.select_related('resume__user', 'job__hr'), id=analysis_id)
     
     try:
         profile = request.user.userprofile
@@ -589,15 +631,9 @@ def accept_candidate(request, analysis_id):
         messages.error(request, 'Access denied.')
         return redirect('dashboard')
     
-    # Create notification for candidate (without emojis for database compatibility)
-    message = f"Congratulations! Your application for the position '{analysis.job.title}' has been accepted.\n\n"
-    message += f"Match Score: {analysis.match_score}%\n"
-    message += f"The HR team will contact you soon with next steps.\n\n"
-    message += f"Best regards,\n{analysis.job.hr.get_full_name() or analysis.job.hr.username}"
-    
     Notification.objects.create(
         user=analysis.resume.user,
-        message=message
+        message=acceptance_message(analysis)
     )
     
     messages.success(request, f'Candidate {analysis.resume.user.get_full_name() or analysis.resume.user.username} has been accepted and notified successfully.')
@@ -607,7 +643,7 @@ def accept_candidate(request, analysis_id):
 @login_required
 def reject_candidate(request, analysis_id):
     """Reject candidate (HR only)"""
-    analysis = get_object_or_404(SkillAnalysis, id=analysis_id)
+    analysis = get_object_or_404(SkillAnalysis.objects.select_related('resume__user', 'job__hr'), id=analysis_id)
     
     try:
         profile = request.user.userprofile
@@ -621,27 +657,9 @@ def reject_candidate(request, analysis_id):
     if request.method == 'POST':
         feedback = request.POST.get('feedback', '').strip()
         
-        # Create professional notification (without emojis)
-        message = f"Thank you for your interest in the position '{analysis.job.title}'.\n\n"
-        message += f"After careful consideration, we have decided to move forward with other candidates whose qualifications more closely match our current needs.\n\n"
-        
-        if feedback:
-            message += f"Feedback from our team:\n{feedback}\n\n"
-        
-        # Add skill gap information
-        missing_skills = parse_skills_from_string(analysis.missing_skills)
-        if missing_skills:
-            message += f"Skills to develop for future opportunities:\n"
-            for skill in missing_skills[:5]:  # Limit to top 5
-                message += f"- {skill}\n"
-            message += "\n"
-        
-        message += f"We encourage you to continue developing your skills and apply for future openings.\n\n"
-        message += f"Best regards,\n{analysis.job.hr.get_full_name() or analysis.job.hr.username}"
-        
         Notification.objects.create(
             user=analysis.resume.user,
-            message=message
+            message=rejection_message(analysis, feedback)
         )
         
         messages.success(request, f'Candidate {analysis.resume.user.get_full_name() or analysis.resume.user.username} has been notified of the decision.')
@@ -653,7 +671,7 @@ def reject_candidate(request, analysis_id):
 @login_required
 def send_feedback(request, analysis_id):
     """Send feedback to candidate (HR only)"""
-    analysis = get_object_or_404(SkillAnalysis, id=analysis_id)
+    analysis = get_object_or_404(SkillAnalysis.objects.select_related('resume__user', 'job__hr'), id=analysis_id)
     
     try:
         profile = request.user.userprofile
@@ -668,36 +686,15 @@ def send_feedback(request, analysis_id):
         feedback = request.POST.get('feedback', '').strip()
         
         if feedback:
-            missing_skills = parse_skills_from_string(analysis.missing_skills)
-            matched_skills = parse_skills_from_string(analysis.matched_skills)
-            suggestions = get_skill_suggestions(missing_skills, matched_skills)
-            
-            message = f"Feedback for your application to '{analysis.job.title}'\n\n"
-            message += f"From: {analysis.job.hr.get_full_name() or analysis.job.hr.username}\n\n"
-            message += f"{feedback}\n\n"
-            message += f"--- Performance Summary ---\n"
-            message += f"Match Score: {analysis.match_score}%\n"
-            message += f"Readiness Level: {analysis.get_readiness_level_display()}\n\n"
-            
-            if suggestions:
-                message += "Skill Development Recommendations:\n"
-                for suggestion in suggestions:
-                    # Remove emojis from suggestions
-                    clean_suggestion = suggestion.replace('📚', '-').replace('💡', '-').replace('🎯', '-').replace('🔗', '-').replace('✓', '').replace('⚠️', '')
-                    message += f"{clean_suggestion}\n"
-            
-            message += f"\nKeep improving and best of luck!\n"
-            
             Notification.objects.create(
                 user=analysis.resume.user,
-                message=message
+                message=feedback_message(analysis, feedback)
             )
             
             messages.success(request, f'Feedback sent successfully to {analysis.resume.user.get_full_name() or analysis.resume.user.username}.')
             return redirect('candidate_detail', analysis_id=analysis_id)
     
-    missing_skills = parse_skills_from_string(analysis.missing_skills)
-    matched_skills = parse_skills_from_string(analysis.matched_skills)
+    matched_skills, missing_skills = analysis.get_skill_lists()
     suggestions = get_skill_suggestions(missing_skills, matched_skills)
     
     context = {
@@ -710,6 +707,37 @@ def send_feedback(request, analysis_id):
     return render(request, 'hr/send_feedback.html', context)
 
 
+@login_required
+def batch_decision(request):
+    """Accept, reject or send feedback to every candidate of a job in a score range (HR only)"""
+    try:
+        profile = request.user.userprofile
+        if profile.role != 'HR':
+            messages.error(request, 'Access denied.')
+            return redirect('dashboard')
+    except UserProfile.DoesNotExist:
+        messages.error(request, 'Access denied.')
+        return redirect('dashboard')
+    
+    if request.method == 'POST':
+        form = BatchDecisionForm(request.POST, user=request.user)
+        if form.is_valid():
+            analyses = (
+                form.get_analyses()
+                .select_related('resume__user', 'job__hr')
+                .defer(*[f'resume__{name}' for name in ResumeQuerySet.TEXT_FIELDS])
+                .prefetch_related('skill_entries')
+            )
+            notified = notify_candidates(analyses, form.cleaned_data['decision'], form.cleaned_data['feedback'])
+            
+            messages.success(request, f'{notified} candidate(s) for {form.cleaned_data["job"].title} have been notified.')
+            return redirect('job_detail', job_id=form.cleaned_data['job'].id)
+    else:
+        form = BatchDecisionForm(initial={'job': request.GET.get('job')}, user=request.user)
+    
+    return render(request, 'hr/batch_decision.html', {'form': form})
+
+
 @login_required
 def analytics(request):
     """HR analytics dashboard"""
@@ -726,33 +754,44 @@ def analytics(request):
     jobs = Job.objects.filter(hr=request.user)
     
     # Calculate statistics
-    total_resumes = analyses.count()
-    total_candidates = analyses.values('resume__user').distinct().count()
-    avg_gap = analyses.aggregate(Avg('gap_percentage'))['gap_percentage__avg'] or 0
-    avg_match = analyses.aggregate(Avg('match_score'))['match_score__avg'] or 0
-    
-    # Top missing skills
-    all_missing_skills = []
-    for analysis in analyses:
-        if analysis.missing_skills:
-            skills = parse_skills_from_string(analysis.missing_skills)
-            all_missing_skills.extend(skills)
-    
-    from collections import Counter
-    skill_counter = Counter(all_missing_skills)
-    top_missing_skills = skill_counter.most_common(5)
-    
-    # Job-wise statistics
+    stats = analyses.aggregate(
+        total_resumes=Count('id'),
+        total_candidates=Count('resume__user', distinct=True),
+        avg_gap=Avg('gap_percentage'),
+        avg_match=Avg('match_score'),
+    )
+    total_resumes = stats['total_resumes']
+    total_candidates = stats['total_candidates']
+    avg_gap = stats['avg_gap'] or 0
+    avg_match = stats['avg_match'] or 0
+    
+    # Top missing and matched skills, counted in the database
+    top_missing_skills = AnalysisSkill.top_skills(analyses, AnalysisSkill.MISSING)
+    top_matched_skills = AnalysisSkill.top_skills(analyses, AnalysisSkill.MATCHED)
+    
+    # Job-wise statistics, one annotated query plus one for the top candidates
+    top_candidate = (
+        SkillAnalysis.objects.filter(job=OuterRef('pk'))
+        .order_by('-match_score', 'id')
+        .values('id')[:1]
+    )
+    jobs = jobs.annotate(
+        total_candidates=Count('skillanalysis'),
+        avg_match_score=Avg('skillanalysis__match_score'),
+        top_candidate_id=Subquery(top_candidate),
+    ).filter(total_candidates__gt=0)
+    top_candidates = SkillAnalysis.objects.select_related('resume__user').in_bulk(
+        [job.top_candidate_id for job in jobs]
+    )
+    
     job_stats = []
     for job in jobs:
-        job_analyses = analyses.filter(job=job)
-        if job_analyses.exists():
-            job_stats.append({
-                'job': job,
-                'total_candidates': job_analyses.count(),
-                'avg_match_score': job_analyses.aggregate(Avg('match_score'))['match_score__avg'] or 0,
-                'top_candidate': job_analyses.order_by('-match_score').first()
-            })
+        job_stats.append({
+            'job': job,
+            'total_candidates': job.total_candidates,
+            'avg_match_score': job.avg_match_score or 0,
+            'top_candidate': top_candidates.get(job.top_candidate_id)
+        })
     
     context = {
         'total_resumes': total_resumes,
@@ -760,6 +799,7 @@ def analytics(request):
         'avg_gap': round(avg_gap, 2),
         'avg_match': round(avg_match, 2),
         'top_missing_skills': top_missing_skills,
+        'top_matched_skills': top_matched_skills,
         'job_stats': job_stats,
     }
     
@@ -769,7 +809,11 @@ def analytics(request):
 @login_required
 def export_analysis(request, analysis_id, format):
     """Export analysis as PDF or JSON"""
-    analysis = get_object_or_404(SkillAnalysis, id=analysis_id)
+    analysis = get_object_or_404(
+        SkillAnalysis.objects.select_related('resume__user', 'job')
+        .defer(*[f'resume__{name}' for name in ResumeQuerySet.TEXT_FIELDS]),
+        id=analysis_id,
+    )
     
     # Check access permissions
     if analysis.resume.user != request.user:
@@ -783,14 +827,15 @@ def export_analysis(request, analysis_id, format):
             return redirect('dashboard')
     
     if format == 'json':
+        matched_skills, missing_skills = analysis.get_skill_lists()
         data = {
             'candidate': analysis.resume.user.get_full_name() or analysis.resume.user.username,
             'job_title': analysis.job.title,
             'match_score': analysis.match_score,
             'gap_percentage': analysis.gap_percentage,
             'readiness_level': analysis.get_readiness_level_display(),
-            'matched_skills': parse_skills_from_string(analysis.matched_skills),
-            'missing_skills': parse_skills_from_string(analysis.missing_skills),
+            'matched_skills': matched_skills,
+            'missing_skills': missing_skills,
             'analyzed_at': analysis.analyzed_at.isoformat(),
         }
         
@@ -802,86 +847,78 @@ def export_analysis(request, analysis_id, format):
         return response
     
     elif format == 'pdf':
-        response = HttpResponse(content_type='application/pdf')
-        response['Content-Disposition'] = f'attachment; filename="analysis_{analysis_id}.pdf"'
-        
-        doc = SimpleDocTemplate(response, pagesize=letter)
-        styles = getSampleStyleSheet()
-        story = []
-        
-        # Title
-        title_style = ParagraphStyle(
-            'CustomTitle',
-            parent=styles['Heading1'],
-            fontSize=18,
-            spaceAfter=30,
-        )
-        story.append(Paragraph("Skill Gap Analysis Report", title_style))
-        story.append(Spacer(1, 12))
-        
-        # Basic info
-        info_data = [
-            ['Candidate:', analysis.resume.user.get_full_name() or analysis.resume.user.username],
-            ['Job Title:', analysis.job.title],
-            ['Match Score:', f"{analysis.match_score}%"],
-            ['Gap Percentage:', f"{analysis.gap_percentage}%"],
-            ['Readiness Level:', analysis.get_readiness_level_display()],
-            ['Analysis Date:', analysis.analyzed_at.strftime('%Y-%m-%d %H:%M')],
-        ]
-        
-        info_table = Table(info_data, colWidths=[2*inch, 4*inch])
-        info_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (0, -1), colors.grey),
-            ('TEXTCOLOR', (0, 0), (0, -1), colors.whitesmoke),
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('FONTNAME', (0, 0), (-1, -1), 'Helvetica'),
-            ('FONTSIZE', (0, 0), (-1, -1), 10),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 12),
-            ('BACKGROUND', (1, 0), (1, -1), colors.beige),
-            ('GRID', (0, 0), (-1, -1), 1, colors.black)
-        ]))
-        
-        story.append(info_table)
-        story.append(Spacer(1, 20))
-        
-        # Skills sections
-        matched_skills = parse_skills_from_string(analysis.matched_skills)
-        missing_skills = parse_skills_from_string(analysis.missing_skills)
-        
-        if matched_skills:
-            story.append(Paragraph("Matched Skills:", styles['Heading2']))
-            for skill in matched_skills:
-                story.append(Paragraph(f"• {skill}", styles['Normal']))
-            story.append(Spacer(1, 12))
-        
-        if missing_skills:
-            story.append(Paragraph("Missing Skills:", styles['Heading2']))
-            for skill in missing_skills:
-                story.append(Paragraph(f"• {skill}", styles['Normal']))
-            story.append(Spacer(1, 12))
-        
-        # Suggestions
-        suggestions = get_skill_suggestions(missing_skills, matched_skills)
-        if suggestions:
-            story.append(Paragraph("Improvement Suggestions:", styles['Heading2']))
-            for suggestion in suggestions:
-                story.append(Paragraph(f"• {suggestion}", styles['Normal']))
-        
-        doc.build(story)
+        # Reports are cached per analysis version, so an unchanged analysis is
+        # neither rendered again nor, for a browser holding it, sent again
+        etag = f'"{analysis.id}-{report_version(analysis)}"'
+        last_modified = int(analysis.updated_at.timestamp())
+        response = get_conditional_response(request, etag=etag, last_modified=last_modified)
+        if response is None:
+            response = FileResponse(
+                get_report(analysis),
+                as_attachment=True,
+                filename=f'analysis_{analysis_id}.pdf',
+                content_type='application/pdf',
+            )
+        response.headers['ETag'] = etag
+        response.headers['Last-Modified'] = http_date(last_modified)
+        patch_cache_control(response, private=True, no_cache=True)
         return response
     
     return redirect('analysis_result', analysis_id=analysis_id)
 
 
+@login_required
+def export_analyses(request, format):
+    """Stream the analyses of a job or filter as CSV, JSON Lines or a ZIP of PDF reports (HR only)"""
+    try:
+        profile = request.user.userprofile
+        if profile.role != 'HR':
+            messages.error(request, 'Access denied.')
+            return redirect('dashboard')
+    except UserProfile.DoesNotExist:
+        messages.error(request, 'Access denied.')
+        return redirect('dashboard')
+    
+    # Same filters as filter_resumes, e.g. ?job=3&min_match_score=70
+    form = FilterForm(request.GET, user=request.user)
+    if not form.is_valid():
+        # Dropping a bad filter would export every analysis instead
+        return JsonResponse({'error': 'Invalid filters.', 'errors': form.errors.get_json_data()}, status=400)
+    
+    analyses = form.filter_queryset(
+        SkillAnalysis.objects.filter(job__hr=request.user)
+        .select_related('resume__user', 'job')
+        .defer(*[f'resume__{name}' for name in ResumeQuerySet.TEXT_FIELDS])
+        .prefetch_related('skill_entries')
+        .order_by('-match_score', 'id')
+    )
+    # Rows are read and written out a chunk at a time, whatever the total
+    analyses = analyses.iterator(chunk_size=EXPORT_CHUNK_SIZE)
+    
+    if format == 'csv':
+        response = StreamingHttpResponse(stream_csv(analyses), content_type='text/csv')
+    elif format == 'jsonl':
+        response = StreamingHttpResponse(stream_jsonl(analyses), content_type='application/x-ndjson')
+    elif format == 'zip':
+        response = StreamingHttpResponse(stream_report_zip(analyses), content_type='application/zip')
+    else:
+        messages.error(request, 'Unknown export format.')
+        return redirect('filter_resumes')
+    
+    response['Content-Disposition'] = f'attachment; filename="analyses_{timezone.now():%Y%m%d_%H%M}.{format}"'
+    return response
+
+
 @login_required
 def available_jobs(request):
     """Show all available jobs for candidates"""
-    jobs = Job.objects.all().order_by('-created_at')
-    paginator = Paginator(jobs, 10)
-    page_number = request.GET.get('page')
-    page_obj = paginator.get_page(page_number)
+    jobs = Job.objects.select_related('hr')
+    page_obj = paginate(request, jobs, 10, ('-created_at', '-id'))
     
-    return render(request, 'user/available_jobs.html', {'page_obj': page_obj})
+    return render(request, 'user/available_jobs.html', {
+        'page_obj': page_obj,
+        'resumes': list(Resume.objects.filter(user=request.user)),
+    })
 
 
 @login_required
@@ -980,9 +1017,9 @@ def candidate_view(request):
     # Get candidate-like data for HR to see the candidate experience
     # Show all resumes and jobs from HR perspective but in candidate view
     resumes = Resume.objects.all()[:5]  # Show all resumes for HR to understand candidate experience
-    analyses = SkillAnalysis.objects.filter(job__hr=request.user)[:5]
+    analyses = SkillAnalysis.objects.filter(job__hr=request.user).for_listing()[:5]
     notifications = Notification.objects.all()[:5]  # Show sample notifications
-    jobs = Job.objects.all()[:10]
+    jobs = Job.objects.select_related('hr')[:10]
     
     context = {
         'resumes': resumes,
@@ -2,4 +2,8 @@ import os
 from django.core.asgi import get_asgi_application
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'resume_skill_gap.settings')
+
+# Serve through an ASGI server, e.g. `uvicorn resume_skill_gap.asgi:application`,
+# so the notification stream (/notifications/stream/) can hold its connections
+# open without tying up a worker per open dashboard
 application = get_asgi_application()
\ No newline at end of file
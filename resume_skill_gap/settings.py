@@ -114,5 +114,30 @@ LOGOUT_REDIRECT_URL = '/login/'
 FILE_UPLOAD_MAX_MEMORY_SIZE = 2 * 1024 * 1024  # 2MB
 DATA_UPLOAD_MAX_MEMORY_SIZE = 2 * 1024 * 1024  # 2MB
 
+# Run resume extraction and analysis in `manage.py run_analysis_worker`
+# instead of inside the request
+ANALYSIS_BACKGROUND = config('ANALYSIS_BACKGROUND', default=True, cast=bool)
+
+# Upper bounds on the text read from one uploaded PDF
+RESUME_MAX_PAGES = config('RESUME_MAX_PAGES', default=50, cast=int)
+RESUME_MAX_CHARS = config('RESUME_MAX_CHARS', default=250000, cast=int)
+
+# Resume parsing runs in a child process killed after this many seconds,
+# with its address space capped at this many megabytes
+RESUME_EXTRACTION_TIMEOUT = config('RESUME_EXTRACTION_TIMEOUT', default=30, cast=int)
+RESUME_EXTRACTION_MEMORY_MB = config('RESUME_EXTRACTION_MEMORY_MB', default=1024, cast=int)
+
+# Rendered PDF analysis reports, one file per analysis version. Kept outside
+# MEDIA_ROOT because reports are only served to users allowed to see them.
+# A relative path is taken from the project directory, not the working directory
+REPORT_CACHE_DIR = str(BASE_DIR / config('REPORT_CACHE_DIR', default='report_cache'))
+
+# Live notification stream: how often it checks for new notifications, and
+# how long one connection stays open before the browser reconnects
+NOTIFICATION_POLL_SECONDS = config('NOTIFICATION_POLL_SECONDS', default=5, cast=int)
+NOTIFICATION_STREAM_SECONDS = config('NOTIFICATION_STREAM_SECONDS', default=300, cast=int)
+# Under a WSGI server each connection answers once, so browsers wait this long between checks
+NOTIFICATION_WSGI_RETRY_SECONDS = config('NOTIFICATION_WSGI_RETRY_SECONDS', default=60, cast=int)
+
 SESSION_COOKIE_AGE = 86400  # 24 hours
 SESSION_EXPIRE_AT_BROWSER_CLOSE = True
\ No newline at end of file
@@ -6,10 +6,7 @@ os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'resume_skill_gap.settings')
 django.setup()
 
 from analyzer.models import SkillAnalysis
-from analyzer.utils import (
-    extract_skills_from_text, parse_skills_from_string, 
-    calculate_skill_match, determine_readiness_level, format_skills_list
-)
+from analyzer.utils import calculate_skill_match
 
 # Get analysis ID from command line or use default
 analysis_id = int(sys.argv[1]) if len(sys.argv) > 1 else 65
@@ -18,17 +15,12 @@ analysis_id = int(sys.argv[1]) if len(sys.argv) > 1 else 65
 analysis = SkillAnalysis.objects.get(id=analysis_id)
 
 # Extract and match skills
-resume_skills = extract_skills_from_text(analysis.resume.extracted_text)
-job_skills = parse_skills_from_string(analysis.job.required_skills)
+resume_skills = analysis.resume.get_skills()
+job_skills = analysis.job.get_required_skills()
 match_result = calculate_skill_match(resume_skills, job_skills)
 
 # Update analysis
-analysis.matched_skills = format_skills_list(match_result['matched_skills'])
-analysis.missing_skills = format_skills_list(match_result['missing_skills'])
-analysis.gap_percentage = match_result['gap_percentage']
-analysis.match_score = match_result['match_score']
-analysis.readiness_level = determine_readiness_level(match_result['match_score'])
-analysis.save()
+analysis.apply_match_result(match_result)
 
 print(f"✓ Successfully Updated Analysis ID {analysis_id}")
 print("=" * 60)